@@ -3,20 +3,24 @@
 import json
 import logging
 import os
+import queue
+import re
 import shutil
 import tempfile
+import threading
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
 from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from dotenv import load_dotenv
-
-from ai_splitter import split_thread_with_ai
+import json_utils
 import webbrowser
 import time
 from datetime import datetime
 import tweepy
 from config import (
+    TwitterCredentials,
     load_twitter_credentials,
     load_twitter_oauth2_credentials,
     save_oauth2_token,
@@ -34,9 +38,10 @@ from twitter_api import (
 from google_drive_api import (
     get_drive_service,
     get_or_create_workspace_folder,
-    download_file,
+    download_files,
     list_files_in_folder,
     read_file_content,
+    shutdown_download_pool,
     write_file_content,
 )
 
@@ -53,15 +58,78 @@ logging.basicConfig(
 
 def _center_window(win: tk.Toplevel) -> None:
     """Center a Toplevel window on its parent."""
-    win.update_idletasks()
-    width = win.winfo_width()
-    height = win.winfo_height()
+    width = win.winfo_reqwidth()
+    height = win.winfo_reqheight()
+    if width <= 1 or height <= 1:
+        # Geometry has not been propagated yet; flush pending layout once to get the size
+        win.update_idletasks()
+        width = win.winfo_reqwidth()
+        height = win.winfo_reqheight()
     x = (win.winfo_screenwidth() // 2) - (width // 2)
     y = (win.winfo_screenheight() // 2) - (height // 2)
-    win.geometry(f"{width}x{height}+{x}+{y}")
+    # Position only: Tk keeps sizing the window from its requested geometry
+    win.geometry(f"+{x}+{y}")
+
+
+@lru_cache(maxsize=512)
+def _count_text(count: int) -> str:
+    """Return the character-count label text for a tweet of ``count`` characters."""
+    return f"{count}/{MAX_TWEET_LEN}"
+
+
+# Promo display strings only depend on the promo's text and image, so they are
+# formatted once and reused every time a promo list is refreshed.
+@lru_cache(maxsize=1024)
+def _promo_list_text(text: str, image_filename: Optional[str]) -> str:
+    """Return the Listbox line for a promotion in the promo selection dialog."""
+    image_info = f"[Image: {image_filename}]" if image_filename else "[No Image]"
+    return f"{text[:80]}... - {image_info}"
+
+
+@lru_cache(maxsize=1024)
+def _promo_tree_values(text: str, image_filename: Optional[str]) -> Tuple[str, str]:
+    """Return the (text, image) Treeview cells for a promotion in the promo manager."""
+    return text.replace("\n", " ")[:80], image_filename or ""
+
+
+def _split_thread_with_ai(**kwargs: Any) -> List[List[str]]:
+    """Run ``ai_splitter.split_thread_with_ai`` with a deferred import.
+
+    ``ai_splitter`` pulls in the OpenAI SDK (httpx, pydantic, anyio), so it is
+    imported on the worker thread the first time the AI split is requested
+    instead of delaying the window on startup.
+    """
+    from ai_splitter import split_thread_with_ai
+
+    return split_thread_with_ai(**kwargs)
+
+
+def _flash_status(widget: tk.Misc, status_var: tk.StringVar, message: str) -> None:
+    """Show ``message`` in a non-modal status label and clear it after a short delay."""
+    status_var.set(message)
+
+    def _clear() -> None:
+        # Leave newer messages alone
+        if status_var.get() == message:
+            status_var.set("")
+
+    widget.after(STATUS_CLEAR_DELAY_MS, _clear)
 
 
 MAX_TWEET_LEN = 280
+_BLANKLINE_RE = re.compile(r"\n\s*\n")  # Manual tweet break: a blank (or whitespace-only) line
+EDIT_RECOUNT_DELAY_MS = 80  # Coalesce bursts of typing into ~12 recounts per second
+RENDER_SYNC_ROWS = 10  # Tweet rows filled before _render_tweets returns
+RENDER_BATCH_ROWS = 5  # Tweet rows filled per idle callback after that
+STATUS_CLEAR_DELAY_MS = 2000
+IMAGE_DIALOG_TITLE = "Select image"
+IMAGE_FILETYPES = (("Images", "*.png *.jpg *.jpeg *.gif *.webp"),)
+AI_MAX_INPUT_CHARS = 20_000  # Larger inputs exceed what the model can split in one request
+FUTURE_POLL_INTERVAL_MS = 100  # How often the Tk loop checks on work running in the executor
+PLAIN_PARSE_ASYNC_CHARS = 20_000  # Plain-Thread inputs above this are parsed off the Tk thread
+PUBLISH_POLL_INTERVAL_MS = 80  # How often the Tk loop drains publish progress events
+PREVIEW_WRAP_CHARS = 70  # Width of a tweet preview, in characters
+PREVIEW_MAX_LINES = 6
 
 
 class LoadThreadDialog(tk.Toplevel):
@@ -99,6 +167,8 @@ class LoadThreadDialog(tk.Toplevel):
 
         self.notebook = ttk.Notebook(master)
         self.notebook.pack(pady=5, padx=5, expand=True, fill="both")
+        # Tab contents are built the first time each tab is shown
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         btn_frame = ttk.Frame(master)
         btn_frame.pack(pady=(10, 0))
@@ -132,17 +202,12 @@ class LoadThreadDialog(tk.Toplevel):
                 continue
 
             frame = ttk.Frame(self.notebook, padding=10)
-            text_area = scrolledtext.ScrolledText(frame, wrap=tk.WORD, height=15, width=80)
-            full_thread_text = "\n\n---\n\n".join(tweets)
-            text_area.insert(tk.END, full_thread_text)
-            text_area.configure(state="disabled")
-            text_area.pack(expand=True, fill="both")
-
             label = f"Thread {idx + 1}"
             if sent_flag:
                 label += " (sent)"
-            self.notebook.add(frame, text=label)
+            # Recorded before add() so a tab-changed event fired by it can resolve the thread
             self.display_threads.append(idx)
+            self.notebook.add(frame, text=label)
 
         if not self.display_threads:
             placeholder = ttk.Frame(self.notebook, padding=20)
@@ -151,8 +216,25 @@ class LoadThreadDialog(tk.Toplevel):
             self.select_btn.config(state="disabled")
         else:
             self.notebook.select(self.notebook.tabs()[0])
+            # Re-selecting the current tab fires no event, so fill it explicitly
+            self._on_tab_changed()
             self.select_btn.config(state="normal")
 
+    def _on_tab_changed(self, event: Optional[tk.Event] = None) -> None:
+        """Fill the newly selected thread tab with its preview if it is still empty."""
+        if not self.display_threads or not self.notebook.tabs():
+            return
+        selected = self.notebook.index(self.notebook.select())
+        frame = self.nametowidget(self.notebook.select())
+        if frame.winfo_children():
+            return
+        tweets = self.threads[self.display_threads[selected]]["tweets"]
+        text_area = scrolledtext.ScrolledText(frame, wrap=tk.WORD, height=15, width=80)
+        full_thread_text = "\n\n---\n\n".join(tweets)
+        text_area.insert(tk.END, full_thread_text)
+        text_area.configure(state="disabled")
+        text_area.pack(expand=True, fill="both")
+
     def _on_select_click(self) -> None:
         selected_tab = self.notebook.index(self.notebook.select()) if self.notebook.tabs() else None
         if selected_tab is None or not self.display_threads:
@@ -169,15 +251,22 @@ class LoadThreadDialog(tk.Toplevel):
         self.destroy()
 
 class AddPromoDialog(tk.Toplevel):
-    """Dialog for adding a new promotional tweet."""
+    """Dialog for adding a new promotional tweet.
+
+    The dialog is built once per parent and hidden between uses; call
+    :meth:`show` to reset it, display it modally and get the result.
+    """
 
     def __init__(self, parent: tk.Toplevel) -> None:  # noqa: D107
         super().__init__(parent)
+        self.withdraw()
         self.transient(parent)
         self.title("Add New Promotion")
         self.parent = parent
         self.result: Optional[tuple[str, Optional[str]]] = None
         self.image_path: Optional[str] = None
+        self._closed = tk.BooleanVar(value=False)
+        self._centered = False
 
         # --- Widgets ---
         body = ttk.Frame(self)
@@ -186,7 +275,22 @@ class AddPromoDialog(tk.Toplevel):
 
         # --- Dialog Behavior ---
         self.protocol("WM_DELETE_WINDOW", self._cancel)
+
+    def show(self) -> Optional[Tuple[str, Optional[str]]]:
+        """Clear previous input, show the dialog and wait until it is closed."""
+        self.result = None
+        self.image_path = None
+        self.text_entry.delete("1.0", tk.END)
+        self.image_label.config(text="Image: (None)")
+
+        self.deiconify()
+        if not self._centered:
+            _center_window(self)
+            self._centered = True
         self.grab_set()
+        self.text_entry.focus_set()
+        self.wait_variable(self._closed)
+        return self.result
 
     def _create_widgets(self, master: ttk.Frame) -> None:
         """Create the input fields for the new promotion."""
@@ -209,16 +313,14 @@ class AddPromoDialog(tk.Toplevel):
 
     def _attach_image(self) -> None:
         """Open file dialog to select an image."""
-        path = filedialog.askopenfilename(
-            title="Select image", filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.webp")]
-        )
+        path = filedialog.askopenfilename(title=IMAGE_DIALOG_TITLE, filetypes=IMAGE_FILETYPES)
         if path:
             self.image_path = path
             self.image_label.config(text=f"Image: {os.path.basename(path)}")
 
     def _save(self) -> None:
         """Save the new promotion."""
-        text = self.text_entry.get("1.0", tk.END).strip()
+        text = self.text_entry.get("1.0", "end-1c").strip()
         if not text:
             messagebox.showwarning("Text Required", "Promotional text cannot be empty.", parent=self)
             return
@@ -227,24 +329,39 @@ class AddPromoDialog(tk.Toplevel):
             return
 
         self.result = (text, self.image_path)
-        self.destroy()
+        self._close()
 
     def _cancel(self) -> None:
         """Cancel adding a promotion."""
         self.result = None
-        self.destroy()
+        self._close()
+
+    def _close(self) -> None:
+        """Hide the dialog for reuse and hand the grab back to the parent dialog."""
+        self.grab_release()
+        self.withdraw()
+        self.parent.grab_set()
+        self._closed.set(True)
 
 
 class SelectPromoDialog(tk.Toplevel):
-    """Dialog for selecting a promotional tweet to append to a thread."""
+    """Dialog for selecting a promotional tweet to append to a thread.
+
+    Like :class:`AddPromoDialog`, it is built once per parent and hidden
+    between uses; call :meth:`show` to refresh it and get the selection.
+    """
 
     def __init__(self, parent: tk.Tk) -> None:  # noqa: D107
         super().__init__(parent)
+        self.withdraw()
         self.transient(parent)
         self.title("Select Promotional Tweet")
         self.parent = parent
         self.promos: List[dict] = []  # Will be populated by _refresh_promo_list
         self.result: Optional[dict] = None
+        self._add_dialog: Optional[AddPromoDialog] = None
+        self._closed = tk.BooleanVar(value=False)
+        self._centered = False
 
         # --- Widgets ---
         body = ttk.Frame(self)
@@ -253,7 +370,20 @@ class SelectPromoDialog(tk.Toplevel):
 
         # --- Dialog Behavior ---
         self.protocol("WM_DELETE_WINDOW", self._cancel)
+
+    def show(self) -> Optional[dict]:
+        """Reload the promotions, show the dialog and wait until it is closed."""
+        self.result = None
+        self._status_var.set("")
+        self._refresh_promo_list()
+
+        self.deiconify()
+        if not self._centered:
+            _center_window(self)
+            self._centered = True
         self.grab_set()
+        self.wait_variable(self._closed)
+        return self.result
 
     def _create_widgets(self, master: ttk.Frame) -> None:
         """Create the listbox and buttons for promo selection."""
@@ -269,8 +399,6 @@ class SelectPromoDialog(tk.Toplevel):
         scrollbar.pack(side="right", fill="y")
         self.promo_listbox.config(yscrollcommand=scrollbar.set)
 
-        self._refresh_promo_list()
-
         # --- Buttons ---
         btn_frame = ttk.Frame(master)
         btn_frame.pack(pady=(10, 0))
@@ -278,27 +406,29 @@ class SelectPromoDialog(tk.Toplevel):
         ttk.Button(btn_frame, text="Add New...", command=self._add_promo_handler).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Cancel", command=self._cancel).pack(side="right", padx=10)
 
+        self._status_var = tk.StringVar(value="")
+        ttk.Label(master, textvariable=self._status_var).pack(anchor="w", pady=(6, 0))
+
     def _refresh_promo_list(self) -> None:
         """Clear and reload the list of promotions from the library."""
         self.promo_listbox.delete(0, tk.END)
         self.promos = get_all_promos()
-        for promo in self.promos:
-            image_filename = promo.get("image_filename")
-            image_info = f"[Image: {image_filename}]" if image_filename else "[No Image]"
-            display_text = f"{promo.get('text', '')[:80]}... - {image_info}"
-            self.promo_listbox.insert(tk.END, display_text)
+        items = [_promo_list_text(promo.get("text", ""), promo.get("image_filename")) for promo in self.promos]
+        if items:
+            # One Tcl call for the whole list instead of one per promotion
+            self.promo_listbox.insert(tk.END, *items)
 
     def _add_promo_handler(self) -> None:
         """Handle adding a new promotion."""
-        dialog = AddPromoDialog(self)
-        _center_window(dialog)
-        self.wait_window(dialog)
-        if dialog.result:
-            text, image_path = dialog.result
+        if self._add_dialog is None:
+            self._add_dialog = AddPromoDialog(self)
+        result = self._add_dialog.show()
+        if result:
+            text, image_path = result
             try:
                 add_promo(text, image_path)
                 self._refresh_promo_list()
-                messagebox.showinfo("Success", "Promotional tweet added.", parent=self)
+                _flash_status(self, self._status_var, "Promotional tweet added.")
             except ValueError as e:
                 messagebox.showerror("Error", str(e), parent=self)
 
@@ -309,12 +439,18 @@ class SelectPromoDialog(tk.Toplevel):
             messagebox.showwarning("No Selection", "Please select a promotion.", parent=self)
             return
         self.result = self.promos[selected_indices[0]]
-        self.destroy()
+        self._close()
 
     def _cancel(self) -> None:
         """Cancel the selection."""
         self.result = None
-        self.destroy()
+        self._close()
+
+    def _close(self) -> None:
+        """Hide the dialog for reuse and release the grab."""
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
 
 
 class GoogleDriveOpenDialog(tk.Toplevel):
@@ -391,14 +527,21 @@ class GoogleDriveOpenDialog(tk.Toplevel):
 
 
 class PromoManagerDialog(tk.Toplevel):
-    """Dialog for managing the promotional tweet library."""
+    """Dialog for managing the promotional tweet library.
+
+    Built once per parent and hidden between uses; call :meth:`show` to open it.
+    """
 
     def __init__(self, parent: tk.Tk) -> None:  # noqa: D107
         super().__init__(parent)
+        self.withdraw()
         self.transient(parent)
         self.title("Manage Promotions")
         self.parent = parent
         self.promos = []
+        self._add_dialog: Optional[AddPromoDialog] = None
+        self._closed = tk.BooleanVar(value=False)
+        self._centered = False
 
         # --- Widgets ---
         body = ttk.Frame(self)
@@ -406,63 +549,85 @@ class PromoManagerDialog(tk.Toplevel):
         body.pack(padx=20, pady=20, expand=True, fill="both")
 
         # --- Dialog Behavior ---
+        self.protocol("WM_DELETE_WINDOW", self._close)
+
+    def show(self) -> None:
+        """Reload the promotions, show the dialog and wait until it is closed."""
+        self._status_var.set("")
+        self._refresh_promo_list()
+
+        self.deiconify()
+        if not self._centered:
+            _center_window(self)
+            self._centered = True
         self.grab_set()
+        self.wait_variable(self._closed)
+
+    def _close(self) -> None:
+        """Hide the dialog for reuse and release the grab."""
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
 
     def _create_widgets(self, master: ttk.Frame) -> None:
         """Create the widgets for managing promotions."""
         ttk.Label(master, text="Saved Promotional Tweets:").pack(anchor="w")
 
-        # --- Listbox for promos ---
+        # --- Treeview for promos (only visible rows are drawn) ---
         list_frame = ttk.Frame(master)
         list_frame.pack(pady=5, expand=True, fill="both")
-        self.promo_listbox = tk.Listbox(list_frame, height=10, width=80)
-        self.promo_listbox.pack(side="left", expand=True, fill="both")
-
-        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.promo_listbox.yview)
+        self.promo_tree = ttk.Treeview(list_frame, columns=("text", "image"), show="headings", height=10)
+        self.promo_tree.heading("text", text="Text")
+        self.promo_tree.heading("image", text="Image")
+        self.promo_tree.column("text", width=480, stretch=True)
+        self.promo_tree.column("image", width=160, stretch=False)
+        self.promo_tree.pack(side="left", expand=True, fill="both")
+
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.promo_tree.yview)
         scrollbar.pack(side="right", fill="y")
-        self.promo_listbox.config(yscrollcommand=scrollbar.set)
-
-        self._refresh_promo_list()
+        self.promo_tree.config(yscrollcommand=scrollbar.set)
 
         # --- Buttons ---
         btn_frame = ttk.Frame(master)
         btn_frame.pack(pady=(10, 0))
         ttk.Button(btn_frame, text="Add New...", command=self._add_promo_handler).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Delete Selected", command=self._delete_promo_handler).pack(side="left", padx=5)
-        ttk.Button(btn_frame, text="Close", command=self.destroy).pack(side="right", padx=5)
+        ttk.Button(btn_frame, text="Close", command=self._close).pack(side="right", padx=5)
+
+        self._status_var = tk.StringVar(value="")
+        ttk.Label(master, textvariable=self._status_var).pack(anchor="w", pady=(6, 0))
 
     def _refresh_promo_list(self) -> None:
         """Clear and reload the list of promotions from the library."""
-        self.promo_listbox.delete(0, tk.END)
+        self.promo_tree.delete(*self.promo_tree.get_children())
         self.promos = get_all_promos()
-        for promo in self.promos:
-            image_filename = promo.get("image_filename")
-            image_info = f"[Image: {image_filename}]" if image_filename else "[No Image]"
-            display_text = f"{promo.get('text', '')[:80]}... - {image_info}"
-            self.promo_listbox.insert(tk.END, display_text)
+        for i, promo in enumerate(self.promos):
+            values = _promo_tree_values(promo.get("text", ""), promo.get("image_filename"))
+            self.promo_tree.insert("", tk.END, iid=str(i), values=values)
+        self.promo_tree.yview_moveto(0)
 
     def _add_promo_handler(self) -> None:
         """Handle adding a new promotion."""
-        dialog = AddPromoDialog(self)
-        _center_window(dialog)
-        self.wait_window(dialog)
-        if dialog.result:
-            text, image_path = dialog.result
+        if self._add_dialog is None:
+            self._add_dialog = AddPromoDialog(self)
+        result = self._add_dialog.show()
+        if result:
+            text, image_path = result
             try:
                 add_promo(text, image_path)
                 self._refresh_promo_list()
-                messagebox.showinfo("Success", "Promotional tweet added.", parent=self)
+                _flash_status(self, self._status_var, "Promotional tweet added.")
             except ValueError as e:
                 messagebox.showerror("Error", str(e), parent=self)
 
     def _delete_promo_handler(self) -> None:
         """Handle deleting a selected promotion."""
-        selected_indices = self.promo_listbox.curselection()
-        if not selected_indices:
+        selected_iids = self.promo_tree.selection()
+        if not selected_iids:
             messagebox.showwarning("No Selection", "Please select a promotion to delete.", parent=self)
             return
 
-        selected_index = selected_indices[0]
+        selected_index = int(selected_iids[0])
         promo_to_delete = self.promos[selected_index]
 
         if messagebox.askyesno(
@@ -478,18 +643,23 @@ def split_text_into_tweets(text: str, limit: int = MAX_TWEET_LEN) -> List[str]:
     """Return a list of tweet-sized chunks from ``text``.
 
     The split respects word boundaries whenever possible and falls back to a
-    hard cut if a single word is longer than ``limit``.
+    hard cut if a single word is longer than ``limit``. The text is scanned
+    once with an index cursor, so only the returned chunks are copied.
     """
     chunks: List[str] = []
     text = text.strip()
-    while len(text) > limit:
-        split_pos = text.rfind(" ", 0, limit)
-        if split_pos == -1:  # no space found ÔÇô hard split
-            split_pos = limit
-        chunks.append(text[:split_pos].strip())
-        text = text[split_pos:].strip()
-    if text:
-        chunks.append(text)
+    n = len(text)
+    i = 0
+    while n - i > limit:
+        split_pos = text.rfind(" ", i, i + limit)
+        if split_pos == -1:  # no space found – hard split
+            split_pos = i + limit
+        chunks.append(text[i:split_pos].strip())
+        i = split_pos
+        while i < n and text[i].isspace():
+            i += 1
+    if i < n:
+        chunks.append(text[i:])
     return chunks
 
 
@@ -512,11 +682,38 @@ class ThreadComposer(tk.Tk):
         self.publish_resume_info: Optional[Dict[str, Any]] = None
         self.opened_drive_thread_file: Optional[Dict[str, str]] = None  # Holds {'id': '...', 'name': '...'}
         self.twitter_client: Optional[tweepy.Client] = None
+        # Access token the cached publishing client in twitter_client was built for.
+        self._client_access_token: Optional[str] = None
+        # Promo dialogs are built on first use and then hidden and reused.
+        self._select_promo_dialog: Optional[SelectPromoDialog] = None
+        self._promo_manager_dialog: Optional[PromoManagerDialog] = None
         self.publish_button_default_text = "\U0001f680 Publish Thread"
         self.publish_button_resume_text = "\U0001f680 Resume Thread"
         self.publish_delay_seconds = 18.0
         self.loaded_drive_threads: List[Dict[str, Any]] = []
         self.loaded_drive_thread_index: Optional[int] = None
+        # Input box text as of the last read; refreshed only after <<Modified>> fires.
+        self._input_text = ""
+        self._input_dirty = True
+        # Tweet edits are coalesced and recounted at most once per EDIT_RECOUNT_DELAY_MS.
+        self._edit_after_id: Optional[str] = None
+        self._pending_edits: Dict[int, tk.Text] = {}
+        # Tweet row widgets, built on demand and reused across renders (see _render_tweets).
+        self._row_pool: List[Dict[str, Any]] = []
+        # Pending idle callback that fills the remaining rows of a long thread.
+        self._render_after_id: Optional[str] = None
+        self._render_lens: List[int] = []
+        # Number of invalid tweets, kept in sync by _validate_one. The count each
+        # row's label currently shows lives on the pooled row (see _show_count).
+        self._invalid_count = 0
+        self._publish_enabled = False  # The publish button starts disabled
+        self._publishing = False
+        # Progress and outcome events from the publish worker, drained by _drain_pub_queue.
+        self._pub_queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        # Runs slow work (AI generation, huge parses) off the Tk thread; see _run_in_background.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="autox")
+        self._busy_jobs = 0
+        self._ai_running = False
 
         # Style for validation labels
         self.style = ttk.Style(self)
@@ -525,10 +722,19 @@ class ThreadComposer(tk.Tk):
         self.style.configure("Valid.TLabel", foreground="black")
 
         self._build_widgets()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Warn user on startup if credentials are not configured
         self.after_idle(self._check_and_init_auth)
 
+    def _on_close(self) -> None:
+        """Drop queued background work and close the main window."""
+        # Running AI requests and Drive downloads cannot be interrupted, but jobs not
+        # yet started are cancelled and the worker threads exit once their current call returns.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        shutdown_download_pool()
+        self.destroy()
+
     def _authenticate_with_twitter(self) -> bool:
         """Guide user through the OAuth 2.0 PKCE authentication flow."""
         creds = load_twitter_oauth2_credentials()
@@ -589,7 +795,11 @@ class ThreadComposer(tk.Tk):
             return False
 
     def _get_refreshed_client(self) -> Optional[tweepy.Client]:
-        """Return a tweepy.Client, refreshing the token if necessary."""
+        """Return a tweepy.Client, refreshing the token if necessary.
+
+        The client is cached and reused for as long as the saved access token is
+        unchanged and not about to expire.
+        """
         token = load_oauth2_token()
         if not token:
             return None
@@ -598,6 +808,14 @@ class ThreadComposer(tk.Tk):
         if not creds.client_id:
             return None
 
+        expiring = token.get("expires_at", 0) < time.time() + 60
+        if (
+            not expiring
+            and self.twitter_client is not None
+            and self._client_access_token == token.get("access_token")
+        ):
+            return self.twitter_client
+
         oauth2_handler = tweepy.OAuth2UserHandler(
             client_id=creds.client_id,
             redirect_uri="http://localhost",
@@ -606,7 +824,7 @@ class ThreadComposer(tk.Tk):
         )
         oauth2_handler.token = token
 
-        if token.get("expires_at", 0) < time.time() + 60:
+        if expiring:
             try:
                 logging.info("Token expired, attempting to refresh...")
                 new_token = oauth2_handler.refresh_token("https://api.twitter.com/2/oauth2/token")
@@ -626,19 +844,24 @@ class ThreadComposer(tk.Tk):
                 full_error = f"{error_message}\n\nPlease authenticate again.\n\nTechnical Details: {error_detail}"
                 logging.error(f"Error refreshing token: {e}")
                 save_oauth2_token({})  # Clear bad token
+                self.twitter_client = None
+                self._client_access_token = None
                 messagebox.showerror("Authentication Error", full_error, parent=self)
                 return None
 
         # The v2 client needs both the OAuth 2.0 bearer token for v2 endpoints
         # and the OAuth 1.0a tokens for v1.1 endpoints (like media uploads).
         oauth1_creds = load_twitter_credentials()
-        return tweepy.Client(
-            bearer_token=oauth2_handler.token["access_token"],
+        access_token = oauth2_handler.token["access_token"]
+        self.twitter_client = tweepy.Client(
+            bearer_token=access_token,
             consumer_key=oauth1_creds.api_key,
             consumer_secret=oauth1_creds.api_secret,
             access_token=oauth1_creds.access_token,
             access_token_secret=oauth1_creds.access_secret,
         )
+        self._client_access_token = access_token
+        return self.twitter_client
 
     def _check_and_init_auth(self) -> None:
         """Check for a saved token and prompt to auth if it's missing."""
@@ -653,9 +876,9 @@ class ThreadComposer(tk.Tk):
 
     def _open_promo_manager(self) -> None:
         """Open the dialog to manage promotional tweets."""
-        dialog = PromoManagerDialog(self)
-        _center_window(dialog)
-        self.wait_window(dialog)
+        if self._promo_manager_dialog is None:
+            self._promo_manager_dialog = PromoManagerDialog(self)
+        self._promo_manager_dialog.show()
 
     def _authenticate_with_google_drive(self) -> None:
         """Initiate Google Drive authentication and set up the workspace folder."""
@@ -720,6 +943,7 @@ class ThreadComposer(tk.Tk):
         ttk.Label(self, text="Enter your full thread (blank line = manual break):").pack(anchor="w", padx=6, pady=(6, 0))
         self.input_box = scrolledtext.ScrolledText(self, height=10, wrap=tk.WORD)
         self.input_box.pack(fill="x", padx=6, pady=6)
+        self.input_box.bind("<<Modified>>", self._on_input_modified)
 
         # --- AI Generation Controls ---
         ai_controls_frame = ttk.LabelFrame(self, text="AI Generation Settings", padding=10)
@@ -763,9 +987,10 @@ class ThreadComposer(tk.Tk):
         ttk.Button(button_frame, text="­ƒíå Parse Plain-Thread", command=self._parse_plain_handler).pack(
             side="left", padx=4
         )
-        ttk.Button(button_frame, text="Ô£¿ Generate with AI", command=self._parse_with_ai_handler).pack(
-            side="left", padx=4
-        )
+        self.ai_btn = ttk.Button(button_frame, text="Ô£¿ Generate with AI", command=self._parse_with_ai_handler)
+        self.ai_btn.pack(side="left", padx=4)
+        # Shown next to the parse buttons only while executor work is running
+        self.busy_progress = ttk.Progressbar(button_frame, mode="indeterminate", length=80)
 
         # --- Scrollable Frame for Tweets ---
         # Create a container for the canvas and scrollbar
@@ -844,6 +1069,10 @@ class ThreadComposer(tk.Tk):
         self.rate_limit_btn = ttk.Button(action_frame, text="Check Rate Limit", command=self._check_rate_limit)
         self.rate_limit_btn.pack(side="left", padx=10)
 
+        # Non-modal feedback for successful actions; errors still use message boxes.
+        self._status_var = tk.StringVar(value="")
+        ttk.Label(self, textvariable=self._status_var).pack(anchor="w", padx=6, pady=(0, 6))
+
     def _check_rate_limit(self) -> None:
         """Fetch and display the current Twitter API rate limit status."""
         client = self._get_refreshed_client()
@@ -897,7 +1126,7 @@ class ThreadComposer(tk.Tk):
             if not content:
                 raise ValueError("File is empty or could not be read.")
 
-            data = json.loads(content)
+            data = json_utils.loads(content)
             raw_threads = data.get("threads")
             if not isinstance(raw_threads, list):
                 raise TypeError("JSON file from Drive is not in the expected format.")
@@ -942,11 +1171,7 @@ class ThreadComposer(tk.Tk):
                 status_msg = "Thread loaded"
                 if thread_meta.get("sent"):
                     status_msg += " (marked as sent)"
-                messagebox.showinfo(
-                    "Thread Loaded",
-                    f"{status_msg} from '{selected_file['name']}' in Google Drive.",
-                    parent=self,
-                )
+                _flash_status(self, self._status_var, f"{status_msg} from '{selected_file['name']}' in Google Drive.")
             else:
                 self.loaded_drive_thread_index = None
         except (json.JSONDecodeError, TypeError, ValueError) as e:
@@ -998,7 +1223,7 @@ class ThreadComposer(tk.Tk):
             self.loaded_drive_thread_index = 0
 
         self.loaded_drive_threads = threads_payload
-        content = json.dumps({"threads": threads_payload}, indent=2, ensure_ascii=False)
+        content = json_utils.dumps({"threads": threads_payload})
 
         try:
             self.config(cursor="watch")
@@ -1035,35 +1260,45 @@ class ThreadComposer(tk.Tk):
             messagebox.showwarning("No Thread", "You must parse or generate a thread first.", parent=self)
             return
 
-        dialog = SelectPromoDialog(self)
-        _center_window(dialog)
-        self.wait_window(dialog)
-        if dialog.result:
-            promo = dialog.result
-            self.tweets.append(promo["text"])
-
+        if self._select_promo_dialog is None:
+            self._select_promo_dialog = SelectPromoDialog(self)
+        promo = self._select_promo_dialog.show()
+        if promo:
+            image = None
             image_id = promo.get("image_id")
             if image_id:
                 # Store a tuple to identify it as a Drive image that needs downloading
                 image_filename = promo.get("image_filename")
-                self.images.append(("drive", image_id, image_filename))
-            else:
-                self.images.append(None)
-
-            self._render_tweets(self.tweets, self.images)  # Re-render the entire thread
-            messagebox.showinfo("Success", "Promotional tweet added to the end of the thread.", parent=self)
+                image = ("drive", image_id, image_filename)
+
+            self._append_row(promo["text"], image)  # Only the new row is filled
+            _flash_status(self, self._status_var, "Promotional tweet added to the end of the thread.")
+
+    def _on_input_modified(self, event: tk.Event) -> None:
+        """Mark the cached input text stale whenever the input box changes."""
+        if self.input_box.edit_modified():
+            self._input_dirty = True
+            # Clearing the flag re-arms <<Modified>> for the next change
+            self.input_box.edit_modified(False)
+
+    def _get_input_text(self) -> str:
+        """Return the input box contents, re-reading the widget only after an edit."""
+        if self._input_dirty:
+            # "end-1c" excludes the newline Tk always appends to Text contents
+            self._input_text = self.input_box.get("1.0", "end-1c")
+            self._input_dirty = False
+        return self._input_text
 
     def _parse_handler(self) -> None:
         """Split the text box contents into individual tweets."""
-        raw = self.input_box.get("1.0", tk.END).strip()
+        raw = self._get_input_text().strip()
         if not raw:
             messagebox.showwarning("Nothing to parse", "Write something first!")
             return
 
-        # Choose strategy: manual breaks (doubleÔÇænewline) or autoÔÇæsplit
-        if "\n\n" in raw:
-            tweets = [seg.strip() for seg in raw.split("\n\n") if seg.strip()]
-        else:
+        # Choose strategy: manual breaks (blank line) or auto-split
+        tweets = [seg for seg in map(str.strip, _BLANKLINE_RE.split(raw)) if seg]
+        if len(tweets) <= 1:
             tweets = split_text_into_tweets(raw)
         logging.info("Parsed %d tweets", len(tweets))
 
@@ -1071,19 +1306,53 @@ class ThreadComposer(tk.Tk):
         if not tweets:
             messagebox.showerror("Parse error", "Could not split text into tweets.")
             return
+        if self._shows_thread(tweets):
+            logging.info("Parsed thread is unchanged; keeping the current rows")
+            return
         if len(tweets) > 50:
             if not messagebox.askyesno("Long thread", f"You are about to post {len(tweets)} tweets. Continue?"):
                 return
 
         self._render_tweets(tweets)
 
+    def _shows_thread(self, tweets: List[str]) -> bool:
+        """Return True if the rows already display exactly ``tweets`` and nothing is in flight.
+
+        Re-parsing unchanged input then leaves the rows and attached images as they
+        are instead of rebuilding them. Once any tweet has been posted the rows are
+        rebuilt anyway, since re-parsing is how the user starts a fresh publish.
+        """
+        return (
+            tweets == self.tweets
+            and not self._pending_edits
+            and self._render_after_id is None
+            and not self._publishing
+            and self.publish_resume_info is None
+            and not any(self.posted_tweet_ids)
+        )
+
     def _parse_plain_handler(self) -> None:
         """Parse the text using the Plain-Thread v1 format."""
-        raw = self.input_box.get("1.0", tk.END)
+        raw = self._get_input_text()
+        if len(raw) > PLAIN_PARSE_ASYNC_CHARS:
+            # Very large pastes are parsed on the executor so the window keeps repainting
+            self._run_in_background(parse_plain_thread, self._on_plain_parsed, self._on_plain_parse_failed, raw)
+            return
         try:
             tweets = parse_plain_thread(raw)
         except Exception as exc:  # pragma: no cover - Tkinter errors not easily testable
-            messagebox.showerror("Parse error", str(exc))
+            self._on_plain_parse_failed(exc)
+            return
+        self._on_plain_parsed(tweets)
+
+    def _on_plain_parse_failed(self, exc: BaseException) -> None:
+        """Report a Plain-Thread format error."""
+        messagebox.showerror("Parse error", str(exc))
+
+    def _on_plain_parsed(self, tweets: List[str]) -> None:
+        """Confirm long threads and render the tweets parsed from Plain-Thread text."""
+        if self._shows_thread(tweets):
+            logging.info("Parsed thread is unchanged; keeping the current rows")
             return
         if len(tweets) > 50:
             if not messagebox.askyesno("Long thread", f"You are about to post {len(tweets)} tweets. Continue?"):
@@ -1092,34 +1361,127 @@ class ThreadComposer(tk.Tk):
 
     def _parse_with_ai_handler(self) -> None:
         """Use the AI splitter to generate multiple thread options from the input text."""
-        raw = self.input_box.get("1.0", tk.END).strip()
+        raw = self._get_input_text().strip()
         if not raw:
             messagebox.showwarning("Nothing to generate", "Write something first!")
             return
+        if len(raw) > AI_MAX_INPUT_CHARS:
+            messagebox.showwarning(
+                "Text too long",
+                f"The text has {len(raw)} characters; the AI can split at most {AI_MAX_INPUT_CHARS} at once.",
+                parent=self,
+            )
+            return
 
-        self.config(cursor="watch")
-        self.update_idletasks()
+        # Get AI generation parameters from the UI
+        model = self.ai_model_var.get()
+        language = self.language_var.get()
+        extra_instructions = self.extra_instructions_box.get("1.0", "end-1c").strip()
+
+        # The OpenAI round-trip runs on the executor so the window keeps repainting;
+        # repeated identical requests are answered from ai_splitter's result cache.
+        self.ai_btn.config(state="disabled")
+        self._ai_running = True
+        # Streamed tweets are queued by the worker and shown by _drain_ai_stream
+        stream_queue: "queue.Queue[Tuple[int, int, str]]" = queue.Queue()
+        # Generate multiple thread versions
+        self._run_in_background(
+            _split_thread_with_ai,
+            self._on_ai_done,
+            self._on_ai_failed,
+            text=raw,
+            model=model,
+            language=language,
+            extra_instructions=extra_instructions,
+            num_versions=3,
+            on_tweet=lambda thread_idx, tweet_idx, tweet: stream_queue.put((thread_idx, tweet_idx, tweet)),
+        )
+        self.after(FUTURE_POLL_INTERVAL_MS, self._drain_ai_stream, stream_queue)
 
-        try:
-            # Get AI generation parameters from the UI
-            model = self.ai_model_var.get()
-            language = self.language_var.get()
-            extra_instructions = self.extra_instructions_box.get("1.0", tk.END).strip()
-
-            # Generate multiple thread versions
-            threads = split_thread_with_ai(
-                text=raw,
-                model=model,
-                language=language,
-                extra_instructions=extra_instructions,
-                num_versions=3,
-            )
-            logging.info("Generated %d thread versions with AI", len(threads))
+    def _drain_ai_stream(self, stream_queue: "queue.Queue[Tuple[int, int, str]]") -> None:
+        """Show how far the streamed AI response has got while the request is running."""
+        if not self._ai_running:
+            return
+        latest = None
+        while True:
+            try:
+                latest = stream_queue.get_nowait()
+            except queue.Empty:
+                break
+        if latest is not None:
+            thread_idx, tweet_idx, _ = latest
+            self._status_var.set(f"Receiving thread {thread_idx + 1}, tweet {tweet_idx + 1}...")
+        self.after(FUTURE_POLL_INTERVAL_MS, self._drain_ai_stream, stream_queue)
+
+    def _run_in_background(
+        self,
+        func: Callable[..., Any],
+        on_result: Callable[[Any], None],
+        on_error: Callable[[BaseException], None],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Run ``func`` on the executor and hand its outcome back on the Tk thread.
 
-            if not threads:
-                messagebox.showerror("AI Error", "The AI returned no threads.", parent=self)
-                return
+        A busy cursor and progress bar are shown until every pending job has finished.
+        """
+        if self._busy_jobs == 0:
+            self.config(cursor="watch")
+            self.busy_progress.pack(side="left", padx=4)
+            self.busy_progress.start(15)
+        self._busy_jobs += 1
+        future = self._executor.submit(func, *args, **kwargs)
+        self.after(FUTURE_POLL_INTERVAL_MS, self._poll_future, future, on_result, on_error)
+
+    def _poll_future(
+        self,
+        future: "Future[Any]",
+        on_result: Callable[[Any], None],
+        on_error: Callable[[BaseException], None],
+    ) -> None:
+        """Check a pending executor job and dispatch its outcome once it has finished."""
+        if not future.done():
+            self.after(FUTURE_POLL_INTERVAL_MS, self._poll_future, future, on_result, on_error)
+            return
+        self._busy_jobs -= 1
+        if self._busy_jobs == 0:
+            self.busy_progress.stop()
+            self.busy_progress.pack_forget()
+            self.config(cursor="")
+        exc = future.exception()
+        if exc is not None:
+            on_error(exc)
+        else:
+            on_result(future.result())
+
+    def _on_ai_done(self, threads: List[List[str]]) -> None:
+        """Handle AI results on the Tk thread and offer to save them to Drive."""
+        self._finish_ai_run()
+        logging.info("Generated %d thread versions with AI", len(threads))
+        if not threads:
+            messagebox.showerror("AI Error", "The AI returned no threads.", parent=self)
+            return
+
+        self._save_ai_threads(threads)
 
+    def _finish_ai_run(self) -> None:
+        """Re-enable the AI button and clear the streaming progress message."""
+        self._ai_running = False
+        self.ai_btn.config(state="normal")
+        self._status_var.set("")
+
+    def _on_ai_failed(self, exc: Exception) -> None:
+        """Report an AI generation failure on the Tk thread."""
+        self._finish_ai_run()
+        logging.error("Failed to generate thread with AI", exc_info=exc)
+        messagebox.showerror("AI Generation Failed", str(exc))
+
+    def _save_ai_threads(self, threads: List[List[str]]) -> None:
+        """Prompt for a filename and save generated thread versions to Google Drive."""
+        self.config(cursor="watch")
+        self.update_idletasks()
+        try:
             # --- Google Drive Integration ---
             drive_service = get_drive_service()
             if not drive_service:
@@ -1145,7 +1507,7 @@ class ThreadComposer(tk.Tk):
 
             # Save the generated threads to Google Drive
             data_to_save = {"threads": threads}
-            content = json.dumps(data_to_save, indent=2, ensure_ascii=False)
+            content = json_utils.dumps(data_to_save)
 
             try:
                 new_file_id = write_file_content(drive_service, filename, content, workspace_id)
@@ -1161,106 +1523,267 @@ class ThreadComposer(tk.Tk):
                 logging.exception("Failed to save AI-generated threads to Google Drive")
                 messagebox.showerror("Save Error", f"Could not save the file to Google Drive:\n{e}", parent=self)
 
-        except (ValueError, RuntimeError) as exc:
-            logging.exception("Failed to generate thread with AI")
-            messagebox.showerror("AI Generation Failed", str(exc))
+        except RuntimeError as exc:
+            logging.exception("Failed to save AI-generated threads to Google Drive")
+            messagebox.showerror("Google Drive Error", str(exc), parent=self)
         finally:
             self.config(cursor="")
 
     def _render_tweets(self, tweets: List[str], images: Optional[List[Any]] = None) -> None:
-        """Display parsed tweets in the preview list."""
-        for w in self.tweets_frame.winfo_children():
-            w.destroy()
+        """Display parsed tweets in the preview list, reusing existing row widgets."""
+        if self._edit_after_id is not None:
+            self.after_cancel(self._edit_after_id)
+            self._edit_after_id = None
+        # Unflushed edits mean those widgets no longer show their recorded text
+        for index in self._pending_edits:
+            self._row_pool[index]["shown_text"] = None
+        self._pending_edits = {}
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
 
         self.tweets = tweets
         # If no images are provided, initialize a list of Nones. Otherwise, use the provided list.
         self.images = images if images is not None else [None] * len(tweets)
-        self.char_count_labels = []
-        self.image_path_labels = []
-        self.publish_status_labels = []
         self.posted_tweet_ids = [None] * len(tweets)
         self.publish_resume_info = None
         self.publish_btn.config(text=self.publish_button_default_text)
 
-        for idx, txt in enumerate(tweets):
-            row = ttk.Frame(self.tweets_frame)
-            row.pack(fill="x", pady=2)
-
-            ttk.Label(row, text=f"{idx + 1:02d}.").pack(side="left", anchor="n", padx=(0, 4))
-
-            # --- Tweet Content ---
-            text_frame = ttk.Frame(row)
-            text_frame.pack(side="left", fill="x", expand=True)
-            preview = tk.Text(text_frame, height=min(6, (len(txt) // 50) + 1), width=70, wrap=tk.WORD)
-            preview.insert("1.0", txt)
-            preview.pack(side="top", fill="x", expand=True)
-            preview.bind("<KeyRelease>", lambda event, i=idx: self._on_tweet_edited(event, i))
-
-            # --- Controls & Indicators ---
-            controls_frame = ttk.Frame(row)
-            controls_frame.pack(side="left", anchor="n", padx=4)
-            ttk.Button(controls_frame, text="Add Image", command=lambda i=idx: self._image_handler(i)).pack(fill="x")
-
-            char_count_label = ttk.Label(controls_frame, text=f"{len(txt)}/{MAX_TWEET_LEN}")
-            char_count_label.pack(fill="x", pady=(4, 0))
-            self.char_count_labels.append(char_count_label)
-
-            image_path_label = ttk.Label(controls_frame, text="", wraplength=120)  # Show which image is attached
-            image_path_label.pack(fill="x", pady=(4, 0))
-            self.image_path_labels.append(image_path_label)
-
-            status_label = ttk.Label(controls_frame, text="Pending")
-            status_label.pack(fill="x", pady=(4, 0))
-            self.publish_status_labels.append(status_label)
-
-            # --- Update image label based on image type ---
-            image_info = self.images[idx]
-            if isinstance(image_info, str):  # Local file path
-                self.image_path_labels[idx].config(text=os.path.basename(image_info))
-            elif isinstance(image_info, (list, tuple)) and image_info[0] == "drive":  # Google Drive file
-                # image_info is a tuple: ('drive', id, filename)
-                filename = image_info[2] if len(image_info) > 2 else "Drive Image"
-                self.image_path_labels[idx].config(text=f"(Drive) {filename}")
-            else:
-                self.image_path_labels[idx].config(text="")
-
-        self._validate_tweets()
-
-    def _validate_tweets(self) -> None:
-        """Check all tweets for errors and update UI accordingly."""
-        all_valid = True
-        for i, tweet_text in enumerate(self.tweets):
-            count = len(tweet_text)
-            label = self.char_count_labels[i]
-            label.config(text=f"{count}/{MAX_TWEET_LEN}")
-            if count > MAX_TWEET_LEN or count == 0:
-                label.config(style="Invalid.TLabel")
-                all_valid = False
-            else:
-                label.config(style="Valid.TLabel")
+        # Rows past the synchronous chunk are hidden until their batch refills them,
+        # so stale text from a previous thread never shows.
+        for row in self._row_pool[min(len(tweets), RENDER_SYNC_ROWS):]:
+            if row["packed"]:
+                row["frame"].pack_forget()
+                row["packed"] = False
+
+        self.char_count_labels = []
+        self.image_path_labels = []
+        self.publish_status_labels = []
+        # Lengths are measured once per render; batches derive heights from them and
+        # the final validation sweep reuses them.
+        self._render_lens = list(map(len, tweets))
+        self._render_tweets_batch(0, RENDER_SYNC_ROWS)
+
+    def _render_tweets_batch(self, start: int, batch: int = RENDER_BATCH_ROWS) -> None:
+        """
+        Fill rows ``start`` to ``start + batch`` and schedule the next batch on idle.
 
-        self.publish_btn.config(state="normal" if all_valid else "disabled")
+        The first rows of a long thread appear immediately; the rest are built while
+        the event loop is otherwise idle. The thread is validated once the last row exists.
+        """
+        self._render_after_id = None
+        tweets = self.tweets
+        lens = self._render_lens
+        end = min(start + batch, len(tweets))
+
+        # Only build the rows the pool is missing; surplus rows are hidden, not destroyed.
+        while len(self._row_pool) < end:
+            self._row_pool.append(self._build_row(len(self._row_pool)))
+
+        for idx in range(start, end):
+            self._fill_row(idx, lens[idx])
+
+        # The label lists only ever hold rows that have been filled, so they grow once per batch.
+        filled_rows = self._row_pool[start:end]
+        self.char_count_labels.extend([row["count"] for row in filled_rows])
+        self.image_path_labels.extend([row["image"] for row in filled_rows])
+        self.publish_status_labels.extend([row["status"] for row in filled_rows])
+
+        if end < len(tweets):
+            self._render_after_id = self.after_idle(self._render_tweets_batch, end)
+            # Publishing stays disabled until every row has been validated
+            self._refresh_publish_state()
+            return
+
+        self._validate_tweets(lens)
+
+    def _fill_row(self, idx: int, length: int) -> None:
+        """Show tweet ``idx`` in its pooled row, packing the row if it is hidden."""
+        row = self._row_pool[idx]
+        if not row["packed"]:
+            # Rows are re-packed in index order, so they end up after the visible ones.
+            row["frame"].pack(fill="x", pady=2)
+            row["packed"] = True
+
+        # Re-parsing mostly yields the same tweets; skip the Text refill when unchanged
+        text = self.tweets[idx]
+        if text != row["shown_text"]:
+            preview = row["text"]
+            # Size the preview from its line breaks plus wrapped lines before inserting,
+            # so Tk lays the row out once
+            height = text.count("\n") + 1 + length // PREVIEW_WRAP_CHARS
+            preview.configure(height=min(PREVIEW_MAX_LINES, height))
+            # One Tcl call swaps the contents instead of a delete followed by an insert
+            preview.replace("1.0", tk.END, text)
+            row["shown_text"] = text
+        row["status"].config(text="Pending")
+
+        # --- Update image label based on image type ---
+        image_info = self.images[idx]
+        if isinstance(image_info, str):  # Local file path
+            row["image"].config(text=os.path.basename(image_info))
+        elif isinstance(image_info, (list, tuple)) and image_info[0] == "drive":  # Google Drive file
+            # image_info is a tuple: ('drive', id, filename)
+            filename = image_info[2] if len(image_info) > 2 else "Drive Image"
+            row["image"].config(text=f"(Drive) {filename}")
+        else:
+            row["image"].config(text="")
+
+    def _append_row(self, text: str, image: Any = None) -> None:
+        """
+        Append one tweet to the rendered thread without refilling the existing rows.
+
+        Publish progress is reset exactly as a full :meth:`_render_tweets` would.
+        """
+        if self._render_after_id is not None:
+            # Rows are still being filled; let the full render pick the new tweet up.
+            self._render_tweets(self.tweets + [text], self.images + [image])
+            return
+
+        self.tweets.append(text)
+        self.images.append(image)
+        self.publish_resume_info = None
+        self.publish_btn.config(text=self.publish_button_default_text)
+        self._reset_publish_progress()
+
+        idx = len(self.tweets) - 1
+        if len(self._row_pool) <= idx:
+            self._row_pool.append(self._build_row(idx))
+        length = len(text)
+        self._fill_row(idx, length)
+        row = self._row_pool[idx]
+        self.char_count_labels.append(row["count"])
+        self.image_path_labels.append(row["image"])
+        self.publish_status_labels.append(row["status"])
+
+        valid = 0 < length <= MAX_TWEET_LEN
+        self._show_count(row, length, valid)
+        if not valid:
+            self._invalid_count += 1
+        self._refresh_publish_state()
+
+    def _build_row(self, idx: int) -> Dict[str, Any]:
+        """Create the widgets for the tweet row at position ``idx`` (not yet packed)."""
+        row = ttk.Frame(self.tweets_frame)
+
+        ttk.Label(row, text=f"{idx + 1:02d}.").pack(side="left", anchor="n", padx=(0, 4))
+
+        # --- Tweet Content ---
+        text_frame = ttk.Frame(row)
+        text_frame.pack(side="left", fill="x", expand=True)
+        preview = tk.Text(text_frame, height=1, width=PREVIEW_WRAP_CHARS, wrap=tk.WORD)
+        preview.pack(side="top", fill="x", expand=True)
+        preview.bind("<KeyRelease>", partial(self._on_tweet_edited, index=idx))
+
+        # --- Controls & Indicators ---
+        controls_frame = ttk.Frame(row)
+        controls_frame.pack(side="left", anchor="n", padx=4)
+        ttk.Button(controls_frame, text="Add Image", command=partial(self._image_handler, idx)).pack(fill="x")
+
+        char_count_label = ttk.Label(controls_frame, text="")
+        char_count_label.pack(fill="x", pady=(4, 0))
+
+        image_path_label = ttk.Label(controls_frame, text="", wraplength=120)  # Show which image is attached
+        image_path_label.pack(fill="x", pady=(4, 0))
+
+        status_label = ttk.Label(controls_frame, text="Pending")
+        status_label.pack(fill="x", pady=(4, 0))
+
+        return {
+            "frame": row,
+            "text": preview,
+            "count": char_count_label,
+            "image": image_path_label,
+            "status": status_label,
+            "packed": False,
+            # The text the preview holds, and what the count label displays;
+            # None until first shown
+            "shown_text": None,
+            "shown_count": None,
+            "shown_valid": None,
+        }
+
+    def _validate_tweets(self, lens: Optional[List[int]] = None) -> None:
+        """Check all tweets for errors and update UI accordingly.
+
+        Args:
+            lens: Precomputed tweet lengths, if the caller already has them.
+        """
+        if lens is None:
+            lens = [len(tweet_text) for tweet_text in self.tweets]
+        self._invalid_count = 0
+        # Pooled rows remember what their label shows, so only rows whose count changed
+        # since the previous thread are reconfigured.
+        for row, count in zip(self._row_pool, lens):
+            valid = 0 < count <= MAX_TWEET_LEN
+            if not valid:
+                self._invalid_count += 1
+            self._show_count(row, count, valid)
+        self._refresh_publish_state()
+
+    def _validate_one(self, index: int, count: int) -> None:
+        """Update a single tweet's character-count label and the running invalid count."""
+        row = self._row_pool[index]
+        valid = 0 < count <= MAX_TWEET_LEN
+        if valid != row["shown_valid"]:
+            self._invalid_count += -1 if valid else 1
+        self._show_count(row, count, valid)
+
+    @staticmethod
+    def _show_count(row: Dict[str, Any], count: int, valid: bool) -> None:
+        """Reconfigure a row's count label, touching only the options that changed."""
+        if count != row["shown_count"]:
+            row["count"].config(text=_count_text(count))
+            row["shown_count"] = count
+        if valid != row["shown_valid"]:
+            row["count"].config(style="Valid.TLabel" if valid else "Invalid.TLabel")
+            row["shown_valid"] = valid
+
+    def _refresh_publish_state(self) -> None:
+        """Enable the publish button only while every tweet is rendered and valid and no publish is running."""
+        enabled = self._invalid_count == 0 and not self._publishing and self._render_after_id is None
+        if enabled != self._publish_enabled:
+            self.publish_btn.config(state="normal" if enabled else "disabled")
+            self._publish_enabled = enabled
 
     def _on_tweet_edited(self, event: tk.Event, index: int) -> None:
-        """Handle text changes in a tweet's text box."""
+        """Record a change in a tweet's text box and schedule a debounced recount."""
         if not isinstance(event.widget, tk.Text):
             return
-        # Get the full content of the text box
-        new_text = event.widget.get("1.0", tk.END).strip()
-        # Update the internal state
-        self.tweets[index] = new_text
-        # Re-validate to update character count and publish button state
-        self._validate_tweets()
+        self._pending_edits[index] = event.widget
+        if self._edit_after_id is None:
+            self._edit_after_id = self.after(EDIT_RECOUNT_DELAY_MS, self._flush_edits)
+
+    def _flush_edits(self) -> None:
+        """Apply all pending tweet edits and re-validate the edited rows once."""
+        pending, self._pending_edits = self._pending_edits, {}
+        self._edit_after_id = None
+        for index, widget in pending.items():
+            # The thread may have been re-rendered since the edit was recorded.
+            if index >= len(self.tweets) or not widget.winfo_exists():
+                continue
+            # "end-1c" excludes the newline Tk always appends to Text contents
+            new_text = widget.get("1.0", "end-1c").strip()
+            self.tweets[index] = new_text
+            # The widget may differ from new_text by stripped whitespace, so force a refill next render
+            self._row_pool[index]["shown_text"] = None
+            # While rows are still being rendered the final full sweep covers this edit
+            if self._render_after_id is None:
+                self._validate_one(index, len(new_text))
+            else:
+                self._render_lens[index] = len(new_text)
+        # Only the edited rows were touched; the button follows the running count
+        self._refresh_publish_state()
 
     def _image_handler(self, index: int) -> None:
         """Prompt the user for an image and attach it to the given tweet."""
-        path = filedialog.askopenfilename(
-            title="Select image", filetypes=[("Images", "*.png *.jpg *.jpeg *.gif *.webp")]
-        )
+        path = filedialog.askopenfilename(title=IMAGE_DIALOG_TITLE, filetypes=IMAGE_FILETYPES)
         if path:
             self.images[index] = path
-            self.image_path_labels[index].config(text=os.path.basename(path))
-            messagebox.showinfo("Image attached", f"Image '{os.path.basename(path)}' added to tweet {index + 1}.")
+            name = os.path.basename(path)
+            self.image_path_labels[index].config(text=name)
+            logging.debug("Attached image %s to tweet %d", path, index + 1)
+            _flash_status(self, self._status_var, f"Image '{name}' added to tweet {index + 1}.")
 
     # --- Publish Progress Helpers ---
     def _set_publish_status(self, index: int, text: str) -> None:
@@ -1307,10 +1830,6 @@ class ThreadComposer(tk.Tk):
             messagebox.showwarning("No Thread", "There is no tweet to publish.", parent=self)
             return
 
-        # This will hold the final list of local image paths for publishing.
-        final_image_paths = list(self.images)
-        temp_dir = None
-        drive_service = None  # Lazily initialized if needed
         resume_info = self.publish_resume_info or {}
         start_index = 0
         initial_reply_id: Optional[int] = None
@@ -1356,59 +1875,158 @@ class ThreadComposer(tk.Tk):
         self._set_publish_status(start_index, "Posting...")
         self.publish_btn.config(text=self.publish_button_default_text)
 
+        # Drive downloads and the paced tweet loop run on a worker thread so the
+        # window stays responsive; the worker only talks to Tk through _pub_queue.
+        self._publishing = True
+        self._refresh_publish_state()
+        self.config(cursor="watch")
+        threading.Thread(
+            target=self._publish_worker,
+            args=(
+                list(zip(self.tweets, self.images)),
+                twitter_client,
+                start_index,
+                initial_reply_id,
+                self.publish_delay_seconds,
+                load_twitter_credentials(),
+            ),
+            daemon=True,
+        ).start()
+        self.after(PUBLISH_POLL_INTERVAL_MS, self._drain_pub_queue)
+
+    def _publish_worker(
+        self,
+        thread: List[Tuple[str, Any]],
+        twitter_client: tweepy.Client,
+        start_index: int,
+        initial_reply_id: Optional[int],
+        delay_seconds: float,
+        oauth1_creds: TwitterCredentials,
+    ) -> None:
+        """
+        Download Drive images and publish the thread, reporting through ``_pub_queue``.
+
+        Runs on a worker thread. Posts ``("progress", (index, tweet_id))`` after each
+        tweet and finishes with either ``("done", posted_ids)`` or ``("error", exc)``.
+        """
         try:
-            self.config(cursor="watch")
-            self.update_idletasks()
+            pairs, temp_dir = self._download_drive_images(thread, start_index)
+            try:
+                # --- Publish the thread with the final image paths ---
+                posted_ids = publish_thread(
+                    pairs,
+                    twitter_client,
+                    start_index=start_index,
+                    initial_reply_id=initial_reply_id,
+                    delay_seconds=delay_seconds,
+                    progress_callback=lambda index, tweet_id: self._pub_queue.put(("progress", (index, tweet_id))),
+                    oauth1_creds=oauth1_creds,
+                )
+            finally:
+                self._cleanup_temp_dir(temp_dir)
+        except Exception as exc:
+            self._pub_queue.put(("error", exc))
+            return
+        self._pub_queue.put(("done", posted_ids))
 
-            # --- Download any images from Google Drive ---
-            for i in range(start_index, len(self.images)):
-                image_info = self.images[i]
-                if isinstance(image_info, (list, tuple)) and image_info[0] == "drive":
-                    if not drive_service:
-                        drive_service = get_drive_service()
-                        if not drive_service:
-                            raise ConnectionError("Could not connect to Google Drive to download images.")
+    def _drain_pub_queue(self) -> None:
+        """Apply queued publish events on the Tk thread until the worker reports an outcome."""
+        while True:
+            try:
+                kind, payload = self._pub_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self._on_publish_progress(*payload)
+            elif kind == "done":
+                self._on_publish_done(payload)
+                return
+            else:
+                self._on_publish_failed(payload)
+                return
+        self.after(PUBLISH_POLL_INTERVAL_MS, self._drain_pub_queue)
+
+    def _download_drive_images(
+        self, thread: List[Tuple[str, Any]], start_index: int
+    ) -> Tuple[List[Tuple[str, Optional[str]]], Optional[str]]:
+        """
+        Replace Drive image references with local copies in a temporary directory.
+
+        Runs on the publish worker thread, so it must not touch any widgets.
 
+        Returns:
+            The ``(text, local_path)`` pairs and the temporary directory to remove afterwards.
+        """
+        temp_dir = None
+        pairs: List[Tuple[str, Optional[str]]] = list(thread)
+        try:
+            downloads: List[Tuple[int, str, str]] = []  # (tweet index, Drive file ID, local path)
+            for i in range(start_index, len(thread)):
+                image_info = thread[i][1]
+                if isinstance(image_info, (list, tuple)) and image_info[0] == "drive":
                     if not temp_dir:
                         temp_dir = tempfile.mkdtemp(prefix="autox_")
                         logging.info(f"Created temporary directory for images: {temp_dir}")
 
                     _, image_id, image_filename = image_info
-                    # Use a default filename if it's somehow missing
+                    # Use a default filename if it's somehow missing; the index prefix keeps
+                    # two images with the same name from overwriting each other.
                     safe_filename = image_filename or f"image_{image_id}.jpg"
-                    local_path = os.path.join(temp_dir, safe_filename)
-
-                    logging.info(f"Downloading Drive image {image_id} to {local_path}...")
-                    success = download_file(drive_service, image_id, local_path)
+                    downloads.append((i, image_id, os.path.join(temp_dir, f"{i:02d}_{safe_filename}")))
+
+            if downloads:
+                # Authenticates once up front; the download threads then share the credentials
+                if not get_drive_service():
+                    raise ConnectionError("Could not connect to Google Drive to download images.")
+                logging.info(f"Downloading {len(downloads)} Drive images to {temp_dir}...")
+                # The images are independent, so they are fetched concurrently
+                results = download_files([(image_id, local_path) for _, image_id, local_path in downloads])
+                for (i, _, local_path), success in zip(downloads, results):
                     if not success:
-                        raise IOError(f"Failed to download image: {safe_filename}")
-
+                        raise IOError(f"Failed to download image: {os.path.basename(local_path)}")
                     # Replace the tuple with the actual local path
-                    final_image_paths[i] = local_path
-
-            # --- Publish the thread with the final image paths ---
-            posted_ids = publish_thread(
-                self.tweets,
-                final_image_paths,
-                twitter_client,
-                start_index=start_index,
-                initial_reply_id=initial_reply_id,
-                delay_seconds=self.publish_delay_seconds,
-                progress_callback=self._on_publish_progress,
-            )
-            for idx, tweet_id in enumerate(posted_ids):
-                if tweet_id:
-                    if idx < len(self.posted_tweet_ids):
-                        self.posted_tweet_ids[idx] = tweet_id
-
-            messagebox.showinfo("Success", "Thread published successfully!", parent=self)
-            self.publish_resume_info = None
-            self.publish_btn.config(text=self.publish_button_default_text)
+                    pairs[i] = (thread[i][0], local_path)
+        except Exception:
+            self._cleanup_temp_dir(temp_dir)
+            raise
+        return pairs, temp_dir
+
+    @staticmethod
+    def _cleanup_temp_dir(temp_dir: Optional[str]) -> None:
+        """Remove the temporary directory holding downloaded Drive images, if any."""
+        # --- Clean up temporary files and directory ---
+        if temp_dir and os.path.exists(temp_dir):
+            try:
+                shutil.rmtree(temp_dir)
+                logging.info(f"Cleaned up temporary directory: {temp_dir}")
+            except Exception as e:
+                logging.error(f"Failed to clean up temporary directory {temp_dir}: {e}")
+
+    def _finish_publish_run(self) -> None:
+        """Restore the cursor and publish button once the worker has finished."""
+        self._publishing = False
+        self.config(cursor="")
+        self._refresh_publish_state()
+
+    def _on_publish_done(self, posted_ids: List[Optional[int]]) -> None:
+        """Handle a successful publish on the Tk thread."""
+        self._finish_publish_run()
+        for idx, tweet_id in enumerate(posted_ids):
+            if tweet_id:
+                if idx < len(self.posted_tweet_ids):
+                    self.posted_tweet_ids[idx] = tweet_id
+
+        messagebox.showinfo("Success", "Thread published successfully!", parent=self)
+        self.publish_resume_info = None
+        self.publish_btn.config(text=self.publish_button_default_text)
 
-            if self.opened_drive_thread_file:
-                self._mark_thread_as_sent()
+        if self.opened_drive_thread_file:
+            self._mark_thread_as_sent()
 
-        except RateLimitError as exc:
+    def _on_publish_failed(self, exc: Exception) -> None:
+        """Report a failed or interrupted publish on the Tk thread and record resume info."""
+        self._finish_publish_run()
+        if isinstance(exc, RateLimitError):
             logging.warning(
                 "Publishing hit Twitter rate limit at tweet %d/%d",
                 exc.next_index + 1,
@@ -1445,8 +2063,8 @@ class ThreadComposer(tk.Tk):
                 "\n".join(message_lines),
                 parent=self,
             )
-        except ThreadPublishPartialError as exc:
-            logging.exception("Thread publishing stopped early")
+        elif isinstance(exc, ThreadPublishPartialError):
+            logging.error("Thread publishing stopped early", exc_info=exc)
             if exc.posted_ids:
                 for idx, tweet_id in enumerate(exc.posted_ids):
                     if tweet_id:
@@ -1472,19 +2090,10 @@ class ThreadComposer(tk.Tk):
                 ),
                 parent=self,
             )
-        except Exception as exc:
-            logging.exception("Failed to publish thread")
+        else:
+            logging.error("Failed to publish thread", exc_info=exc)
             self.publish_btn.config(text=self.publish_button_default_text)
             messagebox.showerror("Error while publishing", str(exc), parent=self)
-        finally:
-            # --- Clean up temporary files and directory ---
-            if temp_dir and os.path.exists(temp_dir):
-                try:
-                    shutil.rmtree(temp_dir)
-                    logging.info(f"Cleaned up temporary directory: {temp_dir}")
-                except Exception as e:
-                    logging.error(f"Failed to clean up temporary directory {temp_dir}: {e}")
-            self.config(cursor="")
 
     def _mark_thread_as_sent(self) -> None:
         """Mark the currently loaded Drive thread as sent within its JSON file."""
@@ -1518,7 +2127,7 @@ class ThreadComposer(tk.Tk):
         entry["sent_at"] = datetime.utcnow().isoformat()
         self.loaded_drive_threads[self.loaded_drive_thread_index] = entry
 
-        content = json.dumps({"threads": self.loaded_drive_threads}, indent=2, ensure_ascii=False)
+        content = json_utils.dumps({"threads": self.loaded_drive_threads})
         try:
             updated_id = write_file_content(drive_service, filename, content, workspace_id, file_id)
             if updated_id:
@@ -1,9 +1,15 @@
+import hashlib
 import json
 import logging
-from typing import List
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import openai
 
+import json_utils
 from config import load_openai_key
 
 # Configure logging
@@ -13,6 +19,105 @@ logger = logging.getLogger(__name__)
 # Using gpt-4o-mini as a powerful and cost-effective alternative.
 AI_MODEL = "gpt-4o-mini"
 
+# Generation can take a while, but a connection that cannot be opened quickly is dead.
+REQUEST_TIMEOUT = openai.Timeout(60.0, connect=5.0)
+
+RESULT_CACHE_SIZE = 32
+
+# Structured Outputs: the API only returns documents matching this schema, so the
+# model cannot stray into another shape and force the user to retry.
+THREADS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "threads",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "threads": {
+                    "type": "array",
+                    "items": {"type": "array", "items": {"type": "string"}},
+                }
+            },
+            "required": ["threads"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Recent results keyed by a digest of the request, most recent last. Threads are
+# stored as tuples so callers can never mutate a cached entry.
+_result_cache: "OrderedDict[bytes, Tuple[Tuple[str, ...], ...]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def clear_result_cache() -> None:
+    """Forget all memoized :func:`split_thread_with_ai` results."""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
+class _ThreadStreamScanner:
+    """
+    Incrementally scan a streamed ``{"threads": [[...], ...]}`` JSON document.
+
+    Chunks are fed as they arrive; every tweet string is reported as soon as its
+    closing quote has been seen. The scanner only tracks nesting and string
+    boundaries, so the complete document is still validated with ``json.loads``.
+    """
+
+    def __init__(self, on_tweet: Callable[[int, int, str], None]) -> None:
+        self._on_tweet = on_tweet
+        self._stack: List[str] = []  # Open containers, "{" or "["
+        self._in_string = False
+        self._escaped = False
+        self._literal: List[str] = []  # Raw characters of the current string, quotes included
+        self._thread_index = -1
+        self._tweet_index = 0
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next piece of the response."""
+        for char in chunk:
+            if self._in_string:
+                self._literal.append(char)
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    self._string_done("".join(self._literal))
+            elif char == '"':
+                self._in_string = True
+                self._literal = [char]
+            elif char in "{[":
+                if char == "[" and self._stack == ["{", "["]:
+                    self._thread_index += 1
+                    self._tweet_index = 0
+                self._stack.append(char)
+            elif char in "}]":
+                if self._stack:
+                    self._stack.pop()
+
+    def _string_done(self, literal: str) -> None:
+        # Only strings directly inside a thread array are tweets; the rest are keys
+        if self._stack != ["{", "[", "["]:
+            return
+        try:
+            tweet = json.loads(literal)
+        except json.JSONDecodeError:
+            return  # The final json.loads reports the malformed document
+        self._on_tweet(self._thread_index, self._tweet_index, tweet)
+        self._tweet_index += 1
+
+
+def _request_key(api_key: str, text: str, model: str, language: str, extra_instructions: str, num_versions: int) -> bytes:
+    """Return a compact digest identifying one generation request."""
+    # The API key is part of the key so switching accounts never serves another account's results
+    raw = "\x1f".join((api_key, model, language, extra_instructions, str(num_versions), text))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).digest()
+
+
 SYSTEM_PROMPT = """
 You are an expert social media manager specializing in creating engaging, human-like content for X (formerly Twitter). Your task is to transform a long text into multiple, distinct, and high-quality thread options.
 
@@ -50,9 +155,122 @@ You are an expert social media manager specializing in creating engaging, human-
 }
 """
 
+# Built once and shared by every request; the SDK only reads the messages it is given.
+_SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+@lru_cache(maxsize=1)
+def _get_client(api_key: str) -> openai.OpenAI:
+    """Return an OpenAI client for ``api_key``, reusing it (and its connection pool) across calls."""
+    return openai.OpenAI(api_key=api_key, timeout=REQUEST_TIMEOUT)
+
+
+def _require_api_key() -> str:
+    """Return the configured OpenAI API key, or raise ``ValueError`` if it is missing."""
+    api_key = load_openai_key()
+    if not api_key:
+        raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in your .env file.")
+    return api_key
+
+
+def _cached_threads(cache_key: bytes) -> Optional[List[List[str]]]:
+    """Return a fresh copy of the memoized threads for ``cache_key``, if any."""
+    with _result_cache_lock:
+        cached = _result_cache.get(cache_key)
+        if cached is not None:
+            _result_cache.move_to_end(cache_key)
+    if cached is None:
+        return None
+    logger.info("Reusing %d cached AI thread versions.", len(cached))
+    return [list(thread) for thread in cached]
+
+
+def _store_threads(cache_key: bytes, threads: List[List[str]]) -> None:
+    """Memoize ``threads`` under ``cache_key``, evicting the least recently used entry."""
+    if not threads:
+        return
+    with _result_cache_lock:
+        _result_cache[cache_key] = tuple(tuple(thread) for thread in threads)
+        if len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+
+
+def _prompt_cache_key(text: str) -> str:
+    """Return a short, stable identifier for ``text`` to route OpenAI prompt caching."""
+    return "autox-" + hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _build_request(text: str, model: str, language: str, extra_instructions: str, num_versions: int) -> Dict[str, Any]:
+    """Return the keyword arguments for the chat completion that splits ``text``."""
+    # The source text comes before the settings: users regenerate the same text with a
+    # different language or version count, and OpenAI's prompt cache matches on the
+    # longest shared prefix (the static system prompt is always byte-identical).
+    user_prompt = (
+        f"Original Text:\n\"\"\"\n{text}\n\"\"\"\n\n"
+        f"Please generate {num_versions} different and distinct thread versions in {language} "
+        f"for the text above. Each version should explore a different angle or aspect of the text.\n"
+    )
+    if extra_instructions:
+        user_prompt += f"\nFollow these additional instructions carefully: {extra_instructions}"
+    return dict(
+        model=model,
+        messages=[
+            _SYSTEM_MESSAGE,
+            {"role": "user", "content": user_prompt},
+        ],
+        response_format=THREADS_RESPONSE_FORMAT,
+        # Requests for the same source text share a cache routing key, so reruns with
+        # other settings land where that text's prefix is already cached. Sent through
+        # extra_body so older SDK versions without the parameter still work.
+        extra_body={"prompt_cache_key": _prompt_cache_key(text)},
+    )
+
+
+def _parse_threads(content: Optional[str], refusal: Optional[str] = None) -> List[List[str]]:
+    """
+    Extract the threads from the model's JSON reply.
+
+    With Structured Outputs the model either returns a document matching the schema
+    or, instead of any content, a ``refusal`` explaining why it would not answer.
+
+    Raises:
+        RuntimeError: If the model refused, or the reply is empty, not JSON, or not
+            an array of string arrays.
+    """
+    if not content:
+        if refusal:
+            raise RuntimeError(f"The AI declined to generate threads: {refusal}")
+        raise RuntimeError("Received an empty response from the AI.")
+    try:
+        parsed_json = json_utils.loads(content)
+        threads = parsed_json.get("threads")
+    except json.JSONDecodeError as e:
+        logger.exception("Failed to decode JSON from AI response.")
+        raise RuntimeError("The AI returned an invalid JSON format.") from e
+    except (AttributeError, KeyError, TypeError) as e:
+        logger.exception("AI response JSON is missing the 'threads' key or is malformed.")
+        raise RuntimeError("The AI response format was unexpected.") from e
+
+    # The schema already guarantees this shape; the check is a cheap guard against
+    # models or proxies that ignore response_format.
+    if not isinstance(threads, list):
+        raise RuntimeError("AI response JSON is not a list.")
+    # Two flat passes rather than a nested generator per thread
+    if not (
+        all(isinstance(thread, list) for thread in threads)
+        and all(isinstance(tweet, str) for tweet in chain.from_iterable(threads))
+    ):
+        raise RuntimeError("AI response is not a valid JSON array of string arrays.")
+    return threads
+
 
 def split_thread_with_ai(
-    text: str, model: str, language: str, extra_instructions: str, num_versions: int = 3
+    text: str,
+    model: str,
+    language: str,
+    extra_instructions: str,
+    num_versions: int = 3,
+    on_tweet: Optional[Callable[[int, int, str], None]] = None,
 ) -> List[List[str]]:
     """
     Uses OpenAI's chat model to split a long text into multiple Twitter thread versions.
@@ -63,6 +281,12 @@ def split_thread_with_ai(
         language: The target language for the threads.
         extra_instructions: Additional user-provided instructions for the AI.
         num_versions: The number of different thread versions to generate.
+        on_tweet: Optional callable invoked with ``(thread_index, tweet_index, text)``
+            as each tweet arrives. When given, the response is streamed; the callback
+            runs on the calling thread.
+
+    Identical requests are answered from a small in-memory LRU cache instead of
+    calling the API again.
 
     Returns:
         A list of lists of strings, where each inner list is a complete thread.
@@ -71,55 +295,42 @@ def split_thread_with_ai(
         ValueError: If the OpenAI API key is not configured.
         RuntimeError: If the API call fails or returns an invalid format.
     """
-    api_key = load_openai_key()
-    if not api_key:
-        raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY in your .env file.")
-
-    client = openai.OpenAI(api_key=api_key)
-
-    # Construct a more detailed user prompt
-    user_prompt = (
-        f"Please generate {num_versions} different and distinct thread versions in {language} "
-        f"for the following text. Each version should explore a different angle or aspect of the text.\n\n"
-        f"Original Text:\n\"\"\"\n{text}\n\"\"\"\n"
-    )
-    if extra_instructions:
-        user_prompt += f"\nFollow these additional instructions carefully: {extra_instructions}"
+    api_key = _require_api_key()
+    cache_key = _request_key(api_key, text, model, language, extra_instructions, num_versions)
+    cached = _cached_threads(cache_key)
+    if cached is not None:
+        return cached
 
+    client = _get_client(api_key)
+    request = _build_request(text, model, language, extra_instructions, num_versions)
     try:
         logger.info("Calling OpenAI API with model %s to generate %d thread versions...", model, num_versions)
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": user_prompt},
-            ],
-            response_format={"type": "json_object"},
-        )
+        if on_tweet is None:
+            response = client.chat.completions.create(**request)
+            message = response.choices[0].message
+            content = message.content
+            refusal = None if content else getattr(message, "refusal", None)
+        else:
+            scanner = _ThreadStreamScanner(on_tweet)
+            parts: List[str] = []
+            refusal_parts: List[str] = []
+            for chunk in client.chat.completions.create(stream=True, **request):
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    parts.append(delta.content)
+                    scanner.feed(delta.content)
+                elif getattr(delta, "refusal", None):
+                    refusal_parts.append(delta.refusal)
+            content = "".join(parts)
+            refusal = "".join(refusal_parts)
         logger.info("Successfully received response from OpenAI API.")
-
-        content = response.choices[0].message.content
-        if not content:
-            raise RuntimeError("Received an empty response from the AI.")
-
-        # Parse the JSON response
-        parsed_json = json.loads(content)
-        threads = parsed_json.get("threads")
-
-        # --- Validation for the new structure ---
-        if not isinstance(threads, list):
-            raise RuntimeError("AI response JSON is not a list.")
-        if not all(isinstance(thread, list) and all(isinstance(tweet, str) for tweet in thread) for thread in threads):
-            raise RuntimeError("AI response is not a valid JSON array of string arrays.")
-
-        return threads
-
     except openai.APIError as e:
         logger.exception("OpenAI API error occurred.")
         raise RuntimeError(f"An error occurred with the OpenAI API: {e}") from e
-    except json.JSONDecodeError as e:
-        logger.exception("Failed to decode JSON from AI response.")
-        raise RuntimeError("The AI returned an invalid JSON format.") from e
-    except (KeyError, TypeError) as e:
-        logger.exception("AI response JSON is missing the 'threads' key or is malformed.")
-        raise RuntimeError("The AI response format was unexpected.") from e
\ No newline at end of file
+
+    threads = _parse_threads(content, refusal)
+    _store_threads(cache_key, threads)
+    return threads
+
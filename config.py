@@ -1,12 +1,16 @@
 """Credential loading utilities."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 import os
 import json
-from typing import Optional, Dict, Any
+import tempfile
+from typing import Optional, Dict, Any, Tuple
 
 from dotenv import load_dotenv
 
+import json_utils
+
 # Load .env file into environment variables
 load_dotenv()
 
@@ -19,18 +23,28 @@ OAUTH2_TOKEN_FILE = "oauth2_token.json"
 
 
 # --- OAuth 1.0a Credentials (for media uploads) ---
-@dataclass
+# Frozen so the cached instances can be shared safely; ``__slots__`` is spelled
+# out because ``dataclass(slots=True)`` needs Python 3.10 and the app supports 3.9.
+@dataclass(frozen=True)
 class TwitterCredentials:
     """Container for Twitter API v1.1 credentials."""
 
+    __slots__ = ("api_key", "api_secret", "access_token", "access_secret")
+
     api_key: str
     api_secret: str
     access_token: str
     access_secret: str
 
 
+@lru_cache(maxsize=1)
 def load_twitter_credentials() -> TwitterCredentials:
-    """Load Twitter v1.1 credentials from environment variables."""
+    """
+    Load Twitter v1.1 credentials from environment variables.
+
+    This and :func:`load_twitter_oauth2_credentials` cache their result; call the
+    loader's ``cache_clear()`` after changing the environment.
+    """
     return TwitterCredentials(
         api_key=os.getenv("TWITTER_API_KEY", ""),
         api_secret=os.getenv("TWITTER_API_SECRET", ""),
@@ -40,14 +54,17 @@ def load_twitter_credentials() -> TwitterCredentials:
 
 
 # --- OAuth 2.0 Credentials (for main API calls) ---
-@dataclass
+@dataclass(frozen=True)
 class TwitterOAuth2Credentials:
     """Container for Twitter API OAuth 2.0 client credentials."""
 
+    __slots__ = ("client_id", "client_secret")
+
     client_id: str
     client_secret: str
 
 
+@lru_cache(maxsize=1)
 def load_twitter_oauth2_credentials() -> TwitterOAuth2Credentials:
     """Load Twitter OAuth 2.0 client credentials from environment variables."""
     return TwitterOAuth2Credentials(
@@ -69,25 +86,86 @@ def load_google_drive_workspace_id() -> str:
     return DEFAULT_WORKSPACE_FOLDER_ID
 
 
+def write_text_atomic(path: str, payload: str) -> None:
+    """Write ``payload`` to ``path`` in one call, replacing the file atomically.
+
+    The text goes to a temporary file in the same directory, which is then moved
+    over ``path`` with ``os.replace``, so a crash never leaves a half-written file.
+
+    Raises:
+        OSError: If the temporary file cannot be written or moved into place.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=directory, prefix=".tmp-", delete=False)
+    try:
+        with tmp:
+            tmp.write(payload)
+        os.replace(tmp.name, path)
+    except BaseException:
+        # Never leave the temporary file behind, whether the write or the move failed
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+# The last token read or written, keyed by the token file's path and mtime at that moment.
+_oauth2_token_cache: Optional[Tuple[Tuple[str, int], Dict[str, Any]]] = None
+
+
+def _token_file_version() -> Optional[Tuple[str, int]]:
+    """Return ``(path, mtime in ns)`` for the token file, or None if it is missing."""
+    try:
+        return OAUTH2_TOKEN_FILE, os.stat(OAUTH2_TOKEN_FILE).st_mtime_ns
+    except OSError:
+        return None
+
+
 def save_oauth2_token(token: Dict[str, Any]) -> None:
-    """Save the OAuth 2.0 token dictionary to a file."""
+    """Save the OAuth 2.0 token dictionary to a file, skipping the write if it is unchanged."""
+    global _oauth2_token_cache
+    cached = _oauth2_token_cache
+    if cached is not None and cached[0] == _token_file_version() and cached[1] == token:
+        return
+    payload = json.dumps(token, indent=2)
     try:
-        with open(OAUTH2_TOKEN_FILE, "w") as f:
-            json.dump(token, f, indent=2)
-    except IOError as e:
-        print(f"Error saving token: {e}")
+        with open(OAUTH2_TOKEN_FILE, "r", encoding="utf-8") as f:
+            unchanged = f.read() == payload
+    except (IOError, UnicodeDecodeError):
+        unchanged = False  # Missing or unreadable file: write it below
+    if not unchanged:
+        try:
+            write_text_atomic(OAUTH2_TOKEN_FILE, payload)
+        except IOError as e:
+            print(f"Error saving token: {e}")
+            return
+    version = _token_file_version()
+    _oauth2_token_cache = (version, dict(token)) if version is not None else None
 
 
 def load_oauth2_token() -> Optional[Dict[str, Any]]:
-    """Load the OAuth 2.0 token dictionary from a file."""
-    if not os.path.exists(OAUTH2_TOKEN_FILE):
+    """
+    Load the OAuth 2.0 token dictionary from a file.
+
+    The parsed token is kept in memory and reused until the file's modification
+    time changes. Callers get their own copy, so mutating it never affects the cache.
+    """
+    global _oauth2_token_cache
+    version = _token_file_version()
+    if version is None:
         return None
+    cached = _oauth2_token_cache
+    if cached is not None and cached[0] == version:
+        return dict(cached[1])
     try:
-        with open(OAUTH2_TOKEN_FILE, "r") as f:
-            return json.load(f)
+        with open(OAUTH2_TOKEN_FILE, "rb") as f:
+            token = json_utils.loads(f.read())
     except (IOError, json.JSONDecodeError) as e:
         print(f"Error loading token: {e}")
         return None
+    _oauth2_token_cache = (version, token)
+    return dict(token)
 
 
 def load_openai_key() -> str:
@@ -1,7 +1,10 @@
 import os
 import logging
 import io
-from typing import Dict, List, Optional
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from google.auth.transport.requests import Request
 from google.auth.exceptions import GoogleAuthError
@@ -9,8 +12,8 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build, Resource
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseUpload, MediaFileUpload, MediaIoBaseDownload
-from config import load_google_drive_workspace_id
+from googleapiclient.http import HttpRequest, MediaIoBaseUpload, MediaFileUpload, MediaIoBaseDownload
+from config import load_google_drive_workspace_id, write_text_atomic
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -24,6 +27,33 @@ CREDENTIALS_FILE = "credentials.json"
 GOOGLE_TOKEN_FILE = "google_token.json"
 WORKSPACE_FOLDER_NAME = "AUTO_X_Workspace"
 WORKSPACE_FOLDER_ID = load_google_drive_workspace_id()
+# Sub-requests per batch call; Drive accepts up to 100 but starts returning
+# errors for large batches well before that.
+DRIVE_BATCH_SIZE = 50
+# Concurrent transfers for the multi-file helpers; Drive throttles a single user
+# well before this becomes CPU-bound.
+DRIVE_MAX_WORKERS = 4
+# Retries (with exponential backoff) for rate-limited or failed chunk requests.
+DRIVE_NUM_RETRIES = 3
+# Uploads up to this size go in one multipart request; larger ones use a resumable
+# session, which costs an extra round-trip but survives dropped connections.
+RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+# Each thread keeps the service it last built, with the access token it was built
+# for. The service's httplib2 connection stays open between calls, so only the
+# first request pays for the TLS handshake. httplib2 is not thread-safe, hence
+# one service per thread rather than one per process.
+_thread_services = threading.local()
+# Credentials shared by all threads; _creds_lock makes loading and refreshing them
+# single-flight.
+_cached_creds: Optional[Credentials] = None
+_creds_lock = threading.Lock()
+# Shared by every download_files call so its threads, and the services cached on
+# them, outlive a single publish. Created on first use; see shutdown_download_pool.
+_download_pool: Optional[ThreadPoolExecutor] = None
+_download_pool_lock = threading.Lock()
+# Access token Drive last answered 401 for; it is refreshed rather than reused even
+# though its expiry time says it is still valid.
+_rejected_token: Optional[str] = None
 _NETWORK_ERROR_HINTS = (
     "unable to find the server",
     "name or service not known",
@@ -32,6 +62,8 @@ _NETWORK_ERROR_HINTS = (
     "temporary failure in name resolution",
     "nodename nor servname provided",
 )
+# One case-insensitive pass per message instead of lowercasing it and scanning once per hint
+_NETWORK_ERROR_RE = re.compile("|".join(map(re.escape, _NETWORK_ERROR_HINTS)), re.IGNORECASE)
 
 
 def _iter_error_chain(error: Exception):
@@ -53,8 +85,7 @@ def _raise_if_connection_issue(error: Exception, context: str) -> None:
         context: Short description of the action that was being attempted.
     """
     for err in _iter_error_chain(error):
-        message = str(err).lower()
-        if any(hint in message for hint in _NETWORK_ERROR_HINTS):
+        if _NETWORK_ERROR_RE.search(str(err)):
             raise ConnectionError(
                 f"{context} failed because the app could not reach Google Drive (www.googleapis.com). "
                 "Verify you have an active internet connection and that no firewall or proxy is blocking "
@@ -62,6 +93,30 @@ def _raise_if_connection_issue(error: Exception, context: str) -> None:
             ) from error
 
 
+def _execute_batched(
+    drive_service: Resource, requests: Sequence[HttpRequest]
+) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Send ``requests`` as Drive batch calls of up to ``DRIVE_BATCH_SIZE`` each.
+
+    Returns one ``(response, exception)`` pair per request, in the order given.
+    Errors for individual sub-requests are returned, not raised.
+    """
+    results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [(None, None)] * len(requests)
+
+    def _store(request_id: str, response: Optional[Dict[str, Any]], exception: Optional[Exception]) -> None:
+        results[int(request_id)] = (response, exception)
+        if isinstance(exception, HttpError):
+            _forget_rejected_credentials(exception)
+
+    for start in range(0, len(requests), DRIVE_BATCH_SIZE):
+        batch = drive_service.new_batch_http_request(callback=_store)
+        for index, request in enumerate(requests[start:start + DRIVE_BATCH_SIZE], start=start):
+            batch.add(request, request_id=str(index))
+        batch.execute()
+    return results
+
+
 def _cleanup_partial_file(path: str) -> None:
     """Best-effort removal for partially downloaded files left on disk."""
     try:
@@ -81,27 +136,37 @@ def _clear_google_token() -> None:
         logger.warning("Failed to delete invalid Google token file '%s': %s", GOOGLE_TOKEN_FILE, cleanup_error)
 
 
-def get_drive_service() -> Optional[Resource]:
+def _load_credentials() -> Optional[Credentials]:
     """
-    Authenticate with Google Drive and return a service object.
+    Return valid Google credentials, refreshing or re-authenticating as needed.
 
-    Handles the OAuth 2.0 flow, including token storage and refresh.
-    Returns a Google Drive API v3 service object if successful, else None.
+    Must be called with ``_creds_lock`` held. The last good credentials are kept in
+    memory, so the token file is only read once per process. They are refreshed
+    shortly before expiry: google-auth reports them as expired a few minutes early,
+    which avoids a 401-refresh-retry cycle.
     """
-    creds = None
+    global _cached_creds, _rejected_token
+    creds = _cached_creds
+    if creds is not None and creds.valid:
+        return creds
 
     # --- Load existing token ---
-    if os.path.exists(GOOGLE_TOKEN_FILE):
+    if creds is None and os.path.exists(GOOGLE_TOKEN_FILE):
         try:
             creds = Credentials.from_authorized_user_file(GOOGLE_TOKEN_FILE, SCOPES)
         except Exception as e:
             logger.error(f"Failed to load token from {GOOGLE_TOKEN_FILE}: {e}")
             creds = None
 
+    # Whatever is on disk already; the file is only rewritten when this changes
+    stored_json = creds.to_json() if creds is not None else None
+    # A token read back from disk may be the one Drive just rejected
+    rejected = creds is not None and _rejected_token is not None and creds.token == _rejected_token
+
     # --- If no valid credentials, start the auth flow ---
-    if not creds or not creds.valid:
+    if not creds or not creds.valid or rejected:
         # --- Handle token refresh ---
-        if creds and creds.expired and creds.refresh_token:
+        if creds and (creds.expired or rejected) and creds.refresh_token:
             logger.info("Google token has expired. Refreshing...")
             try:
                 creds.refresh(Request())
@@ -142,18 +207,69 @@ def get_drive_service() -> Optional[Resource]:
                 return None
 
         # --- Save the credentials for the next run ---
-        if creds:
+        if creds and creds.to_json() != stored_json:
             try:
-                with open(GOOGLE_TOKEN_FILE, "w") as token_file:
-                    token_file.write(creds.to_json())
+                write_text_atomic(GOOGLE_TOKEN_FILE, creds.to_json())
                 logger.info(f"Google token saved to {GOOGLE_TOKEN_FILE}")
             except IOError as e:
                 logger.error(f"Failed to save Google token: {e}")
 
+    if creds and creds.valid and creds.token != _rejected_token:
+        _cached_creds = creds
+        _rejected_token = None
+        return creds
+    _cached_creds = None
+    return None
+
+
+def invalidate_drive_service() -> None:
+    """
+    Forget the in-memory credentials and the calling thread's service.
+
+    The next :func:`get_drive_service` reloads the credentials from disk and
+    refreshes them if they still carry the token being dropped here. Only the
+    calling thread's service is cleared (``threading.local`` gives no access to
+    other threads' entries); the others are rebuilt on their next call because
+    their token no longer matches the refreshed one.
+    """
+    global _cached_creds, _rejected_token
+    with _creds_lock:
+        if _cached_creds is not None:
+            _rejected_token = _cached_creds.token
+        _cached_creds = None
+    _thread_services.__dict__.clear()
+
+
+def _forget_rejected_credentials(error: HttpError) -> None:
+    """Drop the cached credentials when Drive answers 401, so a revoked token is not reused."""
+    if getattr(error.resp, "status", None) == 401:
+        logger.warning("Google Drive rejected the access token; it will be refreshed on the next request.")
+        invalidate_drive_service()
+
+
+def get_drive_service() -> Optional[Resource]:
+    """
+    Authenticate with Google Drive and return a service object.
+
+    Handles the OAuth 2.0 flow, including token storage and refresh.
+    Returns a Google Drive API v3 service object if successful, else None.
+    While the access token is unchanged, each thread gets back the same service,
+    so its HTTP connection is kept alive and reused. Concurrent callers share one
+    refresh (or authentication flow) instead of each starting their own.
+    """
+    with _creds_lock:
+        creds = _load_credentials()
+
     # --- Build and return the service object ---
-    if creds and creds.valid:
+    if creds is not None:
+        cached = getattr(_thread_services, "entry", None)
+        if cached is not None and cached[0] == creds.token:
+            return cached[1]
         try:
-            service = build("drive", "v3", credentials=creds, cache_discovery=False)
+            # The Drive v3 discovery document bundled with the client is used, so
+            # building the service never downloads it.
+            service = build("drive", "v3", credentials=creds, cache_discovery=False, static_discovery=True)
+            _thread_services.entry = (creds.token, service)
             logger.info("Google Drive service created successfully.")
             return service
         except Exception as e:
@@ -178,6 +294,7 @@ def get_or_create_workspace_folder(drive_service: Resource) -> Optional[str]:
                 logger.info(f"Using configured workspace folder ID: {WORKSPACE_FOLDER_ID}")
                 return WORKSPACE_FOLDER_ID
             except HttpError as e:
+                _forget_rejected_credentials(e)
                 logger.error(
                     f"Configured workspace folder ID '{WORKSPACE_FOLDER_ID}' is not accessible: {e}"
                 )
@@ -219,6 +336,7 @@ def get_or_create_workspace_folder(drive_service: Resource) -> Optional[str]:
             return folder_id
 
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"An error occurred while accessing Google Drive: {e}")
         return None
     except Exception as e:
@@ -237,6 +355,7 @@ def find_file_in_folder(drive_service: Resource, filename: str, folder_id: str)
         files = response.get("files", [])
         return files[0]["id"] if files else None
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"Error finding file '{filename}': {e}")
         return None
     except Exception as e:
@@ -254,6 +373,7 @@ def read_file_content(drive_service: Resource, file_id: str) -> Optional[str]:
         content = request.execute().decode("utf-8")
         return content
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"Error reading file content for file ID '{file_id}': {e}")
         return None
     except Exception as e:
@@ -264,12 +384,24 @@ def read_file_content(drive_service: Resource, file_id: str) -> Optional[str]:
         return None
 
 
-def write_file_content(drive_service: Resource, filename: str, content: str, folder_id: str, file_id: Optional[str] = None) -> Optional[str]:
-    """Write content to a file in Google Drive, creating it if it doesn't exist."""
+def write_file_content(
+    drive_service: Resource,
+    filename: str,
+    content: Union[str, bytes],
+    folder_id: str,
+    file_id: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Write content to a file in Google Drive, creating it if it doesn't exist.
+
+    ``content`` may be text or already UTF-8 encoded bytes (e.g. from ``json_utils.dumps``).
+    """
     try:
         file_metadata = {"name": filename, "parents": [folder_id]}
-        media = io.BytesIO(content.encode("utf-8"))
-        media_body = MediaIoBaseUpload(media, mimetype="application/json", resumable=True)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        media_body = MediaIoBaseUpload(
+            io.BytesIO(data), mimetype="application/json", resumable=len(data) > RESUMABLE_UPLOAD_THRESHOLD
+        )
 
         if file_id:
             # Update existing file
@@ -291,6 +423,7 @@ def write_file_content(drive_service: Resource, filename: str, content: str, fol
             logger.info(f"Created file '{filename}' with ID: {created_file['id']}")
             return created_file["id"]
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"Error writing file '{filename}': {e}")
         return None
     except Exception as e:
@@ -306,7 +439,9 @@ def upload_image(drive_service: Resource, local_image_path: str, folder_id: str)
     try:
         filename = os.path.basename(local_image_path)
         file_metadata = {"name": filename, "parents": [folder_id]}
-        media = MediaFileUpload(local_image_path, resumable=True)
+        media = MediaFileUpload(
+            local_image_path, resumable=os.path.getsize(local_image_path) > RESUMABLE_UPLOAD_THRESHOLD
+        )
 
         file = drive_service.files().create(
             body=file_metadata,
@@ -318,6 +453,7 @@ def upload_image(drive_service: Resource, local_image_path: str, folder_id: str)
         logger.info(f"Uploaded image '{filename}' with ID: {image_id}")
         return image_id
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"Error uploading image '{local_image_path}': {e}")
         return None
     except Exception as e:
@@ -335,6 +471,7 @@ def delete_file(drive_service: Resource, file_id: str) -> bool:
         logger.info(f"Successfully deleted file with ID: {file_id}")
         return True
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"Error deleting file with ID '{file_id}': {e}")
         return False
     except Exception as e:
@@ -345,6 +482,34 @@ def delete_file(drive_service: Resource, file_id: str) -> bool:
         return False
 
 
+def delete_files(drive_service: Resource, file_ids: Sequence[str]) -> List[str]:
+    """
+    Delete several files from Google Drive using batch requests.
+
+    Returns:
+        The IDs that were deleted; failures are logged and left out.
+    """
+    if not file_ids:
+        return []
+    try:
+        results = _execute_batched(drive_service, [drive_service.files().delete(fileId=file_id) for file_id in file_ids])
+    except Exception as e:
+        if isinstance(e, ConnectionError):
+            raise
+        _raise_if_connection_issue(e, "Deleting files from Google Drive")
+        logger.error(f"Unexpected error while deleting {len(file_ids)} files: {e}")
+        return []
+
+    deleted = []
+    for file_id, (_, error) in zip(file_ids, results):
+        if error is None:
+            deleted.append(file_id)
+        else:
+            logger.error(f"Error deleting file with ID '{file_id}': {error}")
+    logger.info(f"Deleted {len(deleted)} of {len(file_ids)} files.")
+    return deleted
+
+
 def download_file(drive_service: Resource, file_id: str, local_destination_path: str) -> bool:
     """Download a file from Google Drive to a local path."""
     try:
@@ -354,12 +519,13 @@ def download_file(drive_service: Resource, file_id: str, local_destination_path:
 
             done = False
             while not done:
-                status, done = downloader.next_chunk()
+                status, done = downloader.next_chunk(num_retries=DRIVE_NUM_RETRIES)
                 logger.info(f"Download {int(status.progress() * 100)}%.")
 
         logger.info(f"Successfully downloaded file ID {file_id} to {local_destination_path}")
         return True
     except HttpError as e:
+        _forget_rejected_credentials(e)
         _cleanup_partial_file(local_destination_path)
         logger.error(f"Error downloading file with ID '{file_id}': {e}")
         return False
@@ -372,6 +538,54 @@ def download_file(drive_service: Resource, file_id: str, local_destination_path:
         return False
 
 
+def _download_with_thread_service(item: Tuple[str, str]) -> bool:
+    """Download ``(file_id, local_path)`` using the calling thread's own service."""
+    file_id, local_destination_path = item
+    drive_service = get_drive_service()
+    if drive_service is None:
+        logger.error(f"Could not connect to Google Drive to download file ID {file_id}")
+        return False
+    return download_file(drive_service, file_id, local_destination_path)
+
+
+def download_files(downloads: Sequence[Tuple[str, str]]) -> List[bool]:
+    """
+    Download several ``(file_id, local_path)`` pairs from Google Drive concurrently.
+
+    Each worker thread uses its own service (httplib2 connections cannot be
+    shared between threads). The workers belong to a module-level pool, so at
+    most ``DRIVE_MAX_WORKERS`` downloads run at once and later calls reuse the
+    services, and their open connections, from earlier ones.
+
+    Returns:
+        One success flag per pair, in the order given.
+
+    Raises:
+        ConnectionError: If Google Drive cannot be reached.
+    """
+    if len(downloads) <= 1:
+        return [_download_with_thread_service(item) for item in downloads]
+    global _download_pool
+    with _download_pool_lock:
+        if _download_pool is None:
+            _download_pool = ThreadPoolExecutor(max_workers=DRIVE_MAX_WORKERS, thread_name_prefix="drive-download")
+        pool = _download_pool
+    return list(pool.map(_download_with_thread_service, downloads))
+
+
+def shutdown_download_pool() -> None:
+    """
+    Stop the :func:`download_files` workers, cancelling downloads not yet started.
+
+    Call this when the app closes. A later :func:`download_files` call starts a new pool.
+    """
+    global _download_pool
+    with _download_pool_lock:
+        pool, _download_pool = _download_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def get_or_create_subfolder(drive_service: Resource, folder_name: str, parent_folder_id: str) -> Optional[str]:
     """Find or create a subfolder within a parent folder and return its ID."""
     try:
@@ -394,6 +608,7 @@ def get_or_create_subfolder(drive_service: Resource, folder_name: str, parent_fo
             logger.info(f"Created subfolder '{folder_name}' with ID: {folder.get('id')}")
             return folder.get("id")
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"Error finding or creating subfolder '{folder_name}': {e}")
         return None
     except Exception as e:
@@ -416,6 +631,7 @@ def list_files_in_folder(drive_service: Resource, folder_id: str, mime_type: str
         ).execute()
         return response.get("files", [])
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"Error listing files in folder '{folder_id}': {e}")
         return []
     except Exception as e:
@@ -426,12 +642,22 @@ def list_files_in_folder(drive_service: Resource, folder_id: str, mime_type: str
         return []
 
 
-def move_file(drive_service: Resource, file_id: str, new_parent_id: str) -> bool:
-    """Move a file to a different folder in Google Drive."""
+def move_file(
+    drive_service: Resource, file_id: str, new_parent_id: str, previous_parent_id: Optional[str] = None
+) -> bool:
+    """
+    Move a file to a different folder in Google Drive.
+
+    Pass ``previous_parent_id`` when the current folder is already known to skip
+    the round-trip that looks it up.
+    """
     try:
-        # Retrieve the existing parents to remove them
-        file = drive_service.files().get(fileId=file_id, fields='parents').execute()
-        previous_parents = ",".join(file.get('parents'))
+        if previous_parent_id is None:
+            # Retrieve the existing parents to remove them
+            file = drive_service.files().get(fileId=file_id, fields='parents').execute()
+            previous_parents = ",".join(file.get('parents'))
+        else:
+            previous_parents = previous_parent_id
 
         # Move the file by adding the new parent and removing the old ones
         drive_service.files().update(
@@ -443,6 +669,7 @@ def move_file(drive_service: Resource, file_id: str, new_parent_id: str) -> bool
         logger.info(f"Successfully moved file {file_id} to folder {new_parent_id}")
         return True
     except HttpError as e:
+        _forget_rejected_credentials(e)
         logger.error(f"Error moving file {file_id}: {e}")
         return False
     except Exception as e:
@@ -451,3 +678,51 @@ def move_file(drive_service: Resource, file_id: str, new_parent_id: str) -> bool
         _raise_if_connection_issue(e, "Moving a file within Google Drive")
         logger.error(f"Unexpected error while moving file {file_id}: {e}")
         return False
+
+
+def move_files(drive_service: Resource, file_ids: Sequence[str], new_parent_id: str) -> List[str]:
+    """
+    Move several files to ``new_parent_id`` using batch requests.
+
+    The current parents of all files are fetched in one batch and the moves are
+    sent in a second, instead of two round-trips per file.
+
+    Returns:
+        The IDs that were moved; failures are logged and left out.
+    """
+    if not file_ids:
+        return []
+    try:
+        lookups = _execute_batched(
+            drive_service, [drive_service.files().get(fileId=file_id, fields="parents") for file_id in file_ids]
+        )
+        to_move = []
+        for file_id, (response, error) in zip(file_ids, lookups):
+            if error is not None:
+                logger.error(f"Error moving file {file_id}: {error}")
+                continue
+            to_move.append((file_id, ",".join(response.get("parents", []))))
+        updates = _execute_batched(
+            drive_service,
+            [
+                drive_service.files().update(
+                    fileId=file_id, addParents=new_parent_id, removeParents=parents, fields="id, parents"
+                )
+                for file_id, parents in to_move
+            ],
+        )
+    except Exception as e:
+        if isinstance(e, ConnectionError):
+            raise
+        _raise_if_connection_issue(e, "Moving files within Google Drive")
+        logger.error(f"Unexpected error while moving {len(file_ids)} files: {e}")
+        return []
+
+    moved = []
+    for (file_id, _), (_, error) in zip(to_move, updates):
+        if error is None:
+            moved.append(file_id)
+        else:
+            logger.error(f"Error moving file {file_id}: {error}")
+    logger.info(f"Moved {len(moved)} of {len(file_ids)} files to folder {new_parent_id}")
+    return moved
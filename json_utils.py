@@ -0,0 +1,33 @@
+"""JSON helpers that use orjson when it is installed and the stdlib otherwise."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize ``obj`` to indented UTF-8 JSON bytes.
+
+    Non-ASCII characters are written verbatim (never ``\\u`` escaped) on both
+    code paths, so the output can be handed to a single ``write`` call.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes.
+
+    Invalid input raises ``json.JSONDecodeError`` on both code paths
+    (``orjson.JSONDecodeError`` is a subclass of it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,6 +3,7 @@ import logging
 import os
 from typing import List, Dict, Optional, Any
 
+import json_utils
 from google_drive_api import (
     get_drive_service,
     get_or_create_workspace_folder,
@@ -18,9 +19,23 @@ logger = logging.getLogger(__name__)
 
 PROMOTIONS_FILE = "promotions.json"
 
+# Last promotions list read from or written to Drive; None until the first successful read.
+_promo_cache: Optional[List[Dict[str, Optional[str]]]] = None
+
+
+def clear_promo_cache() -> None:
+    """Forget the cached promotions so the next :func:`get_all_promos` reads Drive again."""
+    global _promo_cache
+    _promo_cache = None
+
 
 def _get_promotions() -> List[Dict[str, Optional[str]]]:
-    """Load all promotional tweets from the JSON file in Google Drive."""
+    """Load all promotional tweets from the JSON file in Google Drive.
+
+    Successful reads refresh the module cache; failures return an empty list
+    without caching it.
+    """
+    global _promo_cache
     drive_service = get_drive_service()
     if not drive_service:
         logger.error("Cannot get promotions: Google Drive service is not available.")
@@ -38,17 +53,18 @@ def _get_promotions() -> List[Dict[str, Optional[str]]]:
     promo_file_id = find_file_in_folder(drive_service, PROMOTIONS_FILE, workspace_id)
     if not promo_file_id:
         logger.info(f"'{PROMOTIONS_FILE}' not found in Drive. Returning empty list.")
+        _promo_cache = []
         return []
 
     try:
         content = read_file_content(drive_service, promo_file_id)
+        promotions = []
         if content:
-            data = json.loads(content)
+            data = json_utils.loads(content)
             # Handle legacy format where the file was just a list of promotions
-            if isinstance(data, list):
-                return data
-            return data.get("promotions", [])
-        return []
+            promotions = data if isinstance(data, list) else data.get("promotions", [])
+        _promo_cache = list(promotions)
+        return promotions
     except (json.JSONDecodeError, IOError) as e:
         logger.error(f"Error reading or parsing promotions file from Drive: {e}")
         return []
@@ -56,6 +72,7 @@ def _get_promotions() -> List[Dict[str, Optional[str]]]:
 
 def _save_promotions(promotions: List[Dict[str, Optional[str]]]) -> None:
     """Save the list of promotional tweets to the JSON file in Google Drive."""
+    global _promo_cache
     drive_service = get_drive_service()
     if not drive_service:
         logger.error("Cannot save promotions: Google Drive service is not available.")
@@ -71,14 +88,25 @@ def _save_promotions(promotions: List[Dict[str, Optional[str]]]) -> None:
         return
 
     promo_file_id = find_file_in_folder(drive_service, PROMOTIONS_FILE, workspace_id)
-    content = json.dumps({"promotions": promotions}, indent=2)
+    content = json_utils.dumps({"promotions": promotions})
 
-    write_file_content(drive_service, PROMOTIONS_FILE, content, workspace_id, promo_file_id)
+    if write_file_content(drive_service, PROMOTIONS_FILE, content, workspace_id, promo_file_id):
+        _promo_cache = list(promotions)
+    else:
+        # The Drive copy is in an unknown state; re-read it next time
+        _promo_cache = None
 
 
 def get_all_promos() -> List[Dict[str, Optional[str]]]:
-    """Return a list of all saved promotional tweets from Google Drive."""
-    return _get_promotions()
+    """
+    Return a list of all saved promotional tweets from Google Drive.
+
+    The list is read from Drive once and then served from a module cache that
+    :func:`add_promo` and :func:`delete_promo` keep up to date.
+    """
+    if _promo_cache is None:
+        return _get_promotions()
+    return list(_promo_cache)
 
 
 def add_promo(text: str, image_path: Optional[str] = None) -> None:
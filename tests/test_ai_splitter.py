@@ -2,10 +2,25 @@ import json
 import unittest
 from unittest.mock import patch, MagicMock
 
-from ai_splitter import split_thread_with_ai, AI_MODEL, SYSTEM_PROMPT
+from ai_splitter import (
+    split_thread_with_ai,
+    clear_result_cache,
+    AI_MODEL,
+    REQUEST_TIMEOUT,
+    SYSTEM_PROMPT,
+    THREADS_RESPONSE_FORMAT,
+    _get_client,
+    _prompt_cache_key,
+)
 
 
 class TestAiSplitter(unittest.TestCase):
+    def setUp(self):
+        _get_client.cache_clear()
+        clear_result_cache()
+        self.addCleanup(_get_client.cache_clear)
+        self.addCleanup(clear_result_cache)
+
     @patch("ai_splitter.load_openai_key", return_value="fake_api_key")
     @patch("ai_splitter.openai.OpenAI")
     def test_split_thread_with_ai_success(self, mock_openai_class, mock_load_key):
@@ -31,11 +46,11 @@ class TestAiSplitter(unittest.TestCase):
 
         # --- Assertions ---
         self.assertEqual(result, expected_threads)
-        mock_openai_class.assert_called_once_with(api_key="fake_api_key")
+        mock_openai_class.assert_called_once_with(api_key="fake_api_key", timeout=REQUEST_TIMEOUT)
         expected_user_prompt = (
+            f'Original Text:\n"""\n{text_to_split}\n"""\n\n'
             f"Please generate {num_versions} different and distinct thread versions in English "
-            f"for the following text. Each version should explore a different angle or aspect of the text.\n\n"
-            f'Original Text:\n"""\n{text_to_split}\n"""\n'
+            f"for the text above. Each version should explore a different angle or aspect of the text.\n"
         )
         mock_client.chat.completions.create.assert_called_once_with(
             model="gpt-4o-mini",
@@ -43,8 +58,15 @@ class TestAiSplitter(unittest.TestCase):
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": expected_user_prompt},
             ],
-            response_format={"type": "json_object"},
+            response_format=THREADS_RESPONSE_FORMAT,
+            extra_body={"prompt_cache_key": _prompt_cache_key(text_to_split)},
         )
+        self.assertTrue(THREADS_RESPONSE_FORMAT["json_schema"]["strict"])
+
+    def test_prompt_cache_key_depends_only_on_text(self):
+        """Test that the cache routing key is stable per text and differs between texts."""
+        self.assertEqual(_prompt_cache_key("Some text"), _prompt_cache_key("Some text"))
+        self.assertNotEqual(_prompt_cache_key("Some text"), _prompt_cache_key("Other text"))
 
     @patch("ai_splitter.load_openai_key", return_value="")
     def test_split_thread_no_api_key(self, mock_load_key):
@@ -87,4 +109,77 @@ class TestAiSplitter(unittest.TestCase):
         mock_client.chat.completions.create.return_value = mock_response
 
         with self.assertRaisesRegex(RuntimeError, "AI response is not a valid JSON array of string arrays."):
-            split_thread_with_ai("Some text", model="gpt-4o-mini", language="English", extra_instructions="")
\ No newline at end of file
+            split_thread_with_ai("Some text", model="gpt-4o-mini", language="English", extra_instructions="")
+
+    @patch("ai_splitter.load_openai_key", return_value="fake_api_key")
+    @patch("ai_splitter.openai.OpenAI")
+    def test_split_thread_reports_model_refusal(self, mock_openai_class, mock_load_key):
+        """Test that a Structured Outputs refusal is surfaced instead of an empty-response error."""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = None
+        mock_response.choices[0].message.refusal = "I can't help with that."
+        mock_openai_class.return_value.chat.completions.create.return_value = mock_response
+
+        with self.assertRaisesRegex(RuntimeError, "declined to generate threads: I can't help with that."):
+            split_thread_with_ai("Some text", model="gpt-4o-mini", language="English", extra_instructions="")
+
+    @patch("ai_splitter.load_openai_key", return_value="fake_api_key")
+    @patch("ai_splitter.openai.OpenAI")
+    def test_client_is_reused_across_calls(self, mock_openai_class, mock_load_key):
+        """Test that repeated generations share one client instead of building a new one."""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = json.dumps({"threads": [["Tweet 1/1"]]})
+        mock_openai_class.return_value.chat.completions.create.return_value = mock_response
+
+        for text in ("Some text", "Other text"):
+            split_thread_with_ai(text, model="gpt-4o-mini", language="English", extra_instructions="")
+
+        mock_openai_class.assert_called_once()
+        self.assertEqual(mock_openai_class.return_value.chat.completions.create.call_count, 2)
+
+    @patch("ai_splitter.load_openai_key", return_value="fake_api_key")
+    @patch("ai_splitter.openai.OpenAI")
+    def test_identical_requests_are_memoized(self, mock_openai_class, mock_load_key):
+        """Test that repeating a request returns the cached threads without calling the API."""
+        mock_create = mock_openai_class.return_value.chat.completions.create
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = json.dumps({"threads": [["Tweet 1/1"]]})
+        mock_create.return_value = mock_response
+
+        first = split_thread_with_ai("Some text", model="gpt-4o-mini", language="English", extra_instructions="")
+        first[0].append("mutated by caller")
+        second = split_thread_with_ai("Some text", model="gpt-4o-mini", language="English", extra_instructions="")
+        split_thread_with_ai("Some text", model="gpt-4o-mini", language="Spanish", extra_instructions="")
+
+        self.assertEqual(second, [["Tweet 1/1"]])
+        self.assertEqual(mock_create.call_count, 2)  # Only the different language missed the cache
+
+    @patch("ai_splitter.load_openai_key", return_value="fake_api_key")
+    @patch("ai_splitter.openai.OpenAI")
+    def test_streamed_tweets_are_reported_as_they_arrive(self, mock_openai_class, mock_load_key):
+        """Test that streaming reports each tweet once its string is complete, escapes included."""
+        expected_threads = [['Say "hi" 1/2', "Back\\slash {not a brace} 2/2"], ["Alt [tweet] 1/1"]]
+        payload = json.dumps({"threads": expected_threads})
+        chunks = []
+        for i in range(0, len(payload), 7):  # Split mid-token, mid-escape and mid-key
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = payload[i:i + 7]
+            chunks.append(chunk)
+        mock_create = mock_openai_class.return_value.chat.completions.create
+        mock_create.return_value = iter(chunks)
+
+        received = []
+        result = split_thread_with_ai(
+            "Some text",
+            model="gpt-4o-mini",
+            language="English",
+            extra_instructions="",
+            on_tweet=lambda thread_idx, tweet_idx, tweet: received.append((thread_idx, tweet_idx, tweet)),
+        )
+
+        self.assertEqual(result, expected_threads)
+        self.assertEqual(
+            received,
+            [(0, 0, expected_threads[0][0]), (0, 1, expected_threads[0][1]), (1, 0, expected_threads[1][0])],
+        )
+        self.assertTrue(mock_create.call_args.kwargs["stream"])
@@ -0,0 +1,85 @@
+import dataclasses
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import config
+
+
+class TestOAuth2TokenFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.token_file = os.path.join(self.tmpdir.name, "oauth2_token.json")
+        patcher = patch("config.OAUTH2_TOKEN_FILE", self.token_file)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def test_save_and_load_round_trip(self):
+        token = {"access_token": "abc", "expires_at": 123}
+        config.save_oauth2_token(token)
+        self.assertEqual(config.load_oauth2_token(), token)
+
+    def test_save_skips_unchanged_token(self):
+        token = {"access_token": "abc"}
+        config.save_oauth2_token(token)
+        with patch("builtins.open", wraps=open) as mock_open:
+            config.save_oauth2_token(token)
+        modes = [call.args[1] for call in mock_open.call_args_list]
+        self.assertNotIn("w", modes)
+
+    def test_load_reuses_parsed_token_until_file_changes(self):
+        config.save_oauth2_token({"access_token": "abc"})
+        with patch("builtins.open", wraps=open) as mock_open:
+            token = config.load_oauth2_token()
+            token["access_token"] = "mutated by caller"
+            self.assertEqual(config.load_oauth2_token(), {"access_token": "abc"})
+        mock_open.assert_not_called()
+
+        with open(self.token_file, "w", encoding="utf-8") as f:
+            f.write('{"access_token": "edited elsewhere"}')
+        os.utime(self.token_file, ns=(0, 1))  # Guarantee a different mtime
+        self.assertEqual(config.load_oauth2_token(), {"access_token": "edited elsewhere"})
+
+    def test_failed_save_keeps_previous_token(self):
+        config.save_oauth2_token({"access_token": "old"})
+        with patch("config.os.replace", side_effect=OSError("disk full")):
+            config.save_oauth2_token({"access_token": "new"})
+        self.assertEqual(config.load_oauth2_token(), {"access_token": "old"})
+        self.assertEqual(os.listdir(self.tmpdir.name), ["oauth2_token.json"])
+
+    def test_failed_write_leaves_no_temporary_file(self):
+        with self.assertRaises(UnicodeEncodeError):
+            config.write_text_atomic(self.token_file, "\ud800")  # Cannot be encoded as UTF-8
+        self.assertEqual(os.listdir(self.tmpdir.name), [])
+
+
+class TestCredentialLoaders(unittest.TestCase):
+    def setUp(self) -> None:
+        config.load_twitter_credentials.cache_clear()
+        self.addCleanup(config.load_twitter_credentials.cache_clear)
+
+    def test_twitter_credentials_are_cached_until_cleared(self):
+        with patch.dict(os.environ, {"TWITTER_API_KEY": "first"}):
+            creds = config.load_twitter_credentials()
+        with patch.dict(os.environ, {"TWITTER_API_KEY": "second"}):
+            self.assertIs(config.load_twitter_credentials(), creds)
+            config.load_twitter_credentials.cache_clear()
+            self.assertEqual(config.load_twitter_credentials().api_key, "second")
+
+    def test_cached_credentials_are_immutable(self):
+        creds = config.load_twitter_credentials()
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            creds.api_key = "changed"
+        self.assertFalse(hasattr(creds, "__dict__"))
+
+    def test_openai_key_follows_the_environment(self):
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "first"}):
+            self.assertEqual(config.load_openai_key(), "first")
+        with patch.dict(os.environ, {"OPENAI_API_KEY": "second"}):
+            self.assertEqual(config.load_openai_key(), "second")
+
+
+if __name__ == "__main__":
+    unittest.main()
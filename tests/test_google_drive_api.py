@@ -0,0 +1,264 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+import google_drive_api
+from google_drive_api import delete_files, download_files, move_file, move_files, write_file_content
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers each sub-request with ``handler``."""
+
+    def __init__(self, service, callback):
+        self.service = service
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.service.batch_sizes.append(len(self.requests))
+        for request_id, request in self.requests:
+            try:
+                self.callback(request_id, self.service.handler(request), None)
+            except Exception as exc:  # Mirrors how the client reports per-request errors
+                self.callback(request_id, None, exc)
+
+
+def make_service(handler):
+    service = MagicMock()
+    service.handler = handler
+    service.batch_sizes = []
+    service.new_batch_http_request.side_effect = lambda callback: FakeBatch(service, callback)
+    # Requests are plain tuples so the handler can see what was asked for
+    service.files.return_value.delete.side_effect = lambda fileId: ("delete", fileId)
+    service.files.return_value.get.side_effect = lambda fileId, fields: ("get", fileId)
+    service.files.return_value.update.side_effect = lambda fileId, **kwargs: ("update", fileId, kwargs)
+    return service
+
+
+class TestDriveBatching(unittest.TestCase):
+    def test_delete_files_batches_and_reports_failures(self):
+        def handler(request):
+            if request[1] == "bad":
+                raise RuntimeError("not found")
+            return {}
+
+        service = make_service(handler)
+        file_ids = [f"id{i}" for i in range(7)] + ["bad"]
+        with patch.object(google_drive_api, "DRIVE_BATCH_SIZE", 3):
+            deleted = delete_files(service, file_ids)
+
+        self.assertEqual(deleted, file_ids[:-1])
+        self.assertEqual(service.batch_sizes, [3, 3, 2])
+
+    def test_move_files_uses_two_batches(self):
+        updates = []
+
+        def handler(request):
+            if request[0] == "get":
+                return {"parents": ["old"]}
+            updates.append(request)
+            return {}
+
+        service = make_service(handler)
+        moved = move_files(service, ["a", "b"], "new")
+
+        self.assertEqual(moved, ["a", "b"])
+        self.assertEqual(service.batch_sizes, [2, 2])
+        self.assertEqual(
+            [(file_id, kwargs["addParents"], kwargs["removeParents"]) for _, file_id, kwargs in updates],
+            [("a", "new", "old"), ("b", "new", "old")],
+        )
+
+    def test_move_file_skips_lookup_when_parent_is_known(self):
+        service = MagicMock()
+        self.assertTrue(move_file(service, "a", "new", previous_parent_id="old"))
+        service.files.return_value.get.assert_not_called()
+        service.files.return_value.update.assert_called_once_with(
+            fileId="a", addParents="new", removeParents="old", fields="id, parents"
+        )
+
+
+class TestConnectionErrors(unittest.TestCase):
+    def test_network_failures_anywhere_in_the_chain_become_connection_errors(self):
+        try:
+            try:
+                raise OSError("[Errno -3] Temporary failure in name resolution")
+            except OSError as low_level:
+                raise RuntimeError("request failed") from low_level
+        except RuntimeError as error:
+            with self.assertRaisesRegex(ConnectionError, "Listing files failed"):
+                google_drive_api._raise_if_connection_issue(error, "Listing files")
+
+    def test_other_errors_are_left_alone(self):
+        google_drive_api._raise_if_connection_issue(ValueError("bad request"), "Listing files")
+
+
+class TestUploads(unittest.TestCase):
+    def test_small_payloads_use_a_single_multipart_request(self):
+        service = MagicMock()
+        service.files.return_value.create.return_value.execute.return_value = {"id": "new"}
+        with patch.object(google_drive_api, "RESUMABLE_UPLOAD_THRESHOLD", 10):
+            write_file_content(service, "small.json", "{}", "folder")
+            write_file_content(service, "large.json", b"x" * 11, "folder")
+
+        media = [call.kwargs["media_body"] for call in service.files.return_value.create.call_args_list]
+        self.assertEqual([m.resumable() for m in media], [False, True])
+
+
+class TestDownloadFiles(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(google_drive_api.shutdown_download_pool)
+
+    @patch("google_drive_api.download_file")
+    @patch("google_drive_api.get_drive_service")
+    def test_downloads_run_on_worker_threads_and_keep_order(self, mock_get_service, mock_download):
+        services = {}
+
+        def service_for_thread():
+            return services.setdefault(threading.get_ident(), MagicMock())
+
+        mock_get_service.side_effect = service_for_thread
+        mock_download.side_effect = lambda service, file_id, path: file_id != "missing"
+
+        results = download_files([("a", "/tmp/a"), ("missing", "/tmp/m"), ("c", "/tmp/c")])
+
+        self.assertEqual(results, [True, False, True])
+        for call in mock_download.call_args_list:
+            self.assertIn(call.args[0], services.values())  # Each download used its thread's service
+
+    @patch("google_drive_api.download_file", return_value=True)
+    @patch("google_drive_api.get_drive_service")
+    def test_worker_threads_are_shared_between_calls(self, mock_get_service, _download):
+        threads = set()
+
+        def service_for_thread():
+            threads.add(threading.current_thread())
+            return MagicMock()
+
+        mock_get_service.side_effect = service_for_thread
+
+        for _ in range(3):
+            download_files([(f"id{i}", f"/tmp/{i}") for i in range(google_drive_api.DRIVE_MAX_WORKERS)])
+
+        self.assertLessEqual(len(threads), google_drive_api.DRIVE_MAX_WORKERS)
+
+    @patch("google_drive_api.download_file", return_value=True)
+    @patch("google_drive_api.get_drive_service")
+    def test_pool_is_created_on_first_use_and_dropped_on_shutdown(self, _get_service, _download):
+        google_drive_api.shutdown_download_pool()
+        self.assertIsNone(google_drive_api._download_pool)
+
+        download_files([("a", "/tmp/a"), ("b", "/tmp/b")])
+        pool = google_drive_api._download_pool
+        self.assertIsNotNone(pool)
+
+        google_drive_api.shutdown_download_pool()
+        self.assertIsNone(google_drive_api._download_pool)
+        with self.assertRaises(RuntimeError):
+            pool.submit(print)  # The old pool no longer accepts work
+
+
+class TestDriveServiceReuse(unittest.TestCase):
+    def setUp(self):
+        google_drive_api.invalidate_drive_service()
+        self.addCleanup(google_drive_api.invalidate_drive_service)
+        patcher = patch.object(google_drive_api, "_rejected_token", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("google_drive_api.build")
+    @patch("google_drive_api.Credentials.from_authorized_user_file")
+    @patch("google_drive_api.os.path.exists", return_value=True)
+    def test_service_is_reused_while_token_is_unchanged(self, _exists, mock_from_file, mock_build):
+        creds = MagicMock(valid=True, token="token-1")
+        mock_from_file.return_value = creds
+        mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+
+        first = google_drive_api.get_drive_service()
+        self.assertIs(google_drive_api.get_drive_service(), first)
+        creds.token = "token-2"
+        self.assertIsNot(google_drive_api.get_drive_service(), first)
+        self.assertEqual(mock_build.call_count, 2)
+        mock_from_file.assert_called_once()  # Credentials stay in memory after the first read
+
+    @patch("google_drive_api.write_text_atomic")
+    @patch("google_drive_api.build")
+    @patch("google_drive_api.Credentials.from_authorized_user_file")
+    @patch("google_drive_api.os.path.exists", return_value=True)
+    def test_expiring_credentials_are_refreshed_once_for_concurrent_callers(
+        self, _exists, mock_from_file, mock_build, mock_write
+    ):
+        creds = MagicMock(valid=False, expired=True, refresh_token="refresh", token="old")
+
+        def refresh(request):
+            creds.valid, creds.expired, creds.token = True, False, "new"
+
+        creds.refresh.side_effect = refresh
+        creds.to_json.side_effect = lambda: creds.token
+        mock_from_file.return_value = creds
+
+        threads = [threading.Thread(target=google_drive_api.get_drive_service) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        creds.refresh.assert_called_once()
+        mock_write.assert_called_once()
+
+    @patch("google_drive_api.write_text_atomic")
+    @patch("google_drive_api.build")
+    @patch("google_drive_api.Credentials.from_authorized_user_file")
+    @patch("google_drive_api.os.path.exists", return_value=True)
+    def test_unauthorized_response_forces_a_refresh(self, _exists, mock_from_file, mock_build, mock_write):
+        creds = MagicMock(valid=True, expired=False, refresh_token="refresh", token="revoked")
+
+        def refresh(request):
+            creds.token = "fresh"
+
+        creds.refresh.side_effect = refresh
+        creds.to_json.side_effect = lambda: creds.token
+        mock_from_file.return_value = creds  # The token file still holds the revoked token
+        mock_build.side_effect = lambda *args, **kwargs: MagicMock()
+
+        service = google_drive_api.get_drive_service()
+        service.files.return_value.get_media.return_value.execute.side_effect = HttpError(
+            httplib2.Response({"status": 401}), b"{}"
+        )
+        self.assertIsNone(google_drive_api.read_file_content(service, "file"))
+        creds.refresh.assert_not_called()
+
+        self.assertIsNot(google_drive_api.get_drive_service(), service)
+        creds.refresh.assert_called_once()
+        self.assertEqual(creds.token, "fresh")
+        mock_write.assert_called_once_with(google_drive_api.GOOGLE_TOKEN_FILE, "fresh")
+
+    @patch("google_drive_api.write_text_atomic")
+    @patch("google_drive_api.build")
+    @patch("google_drive_api.Credentials.from_authorized_user_file")
+    @patch("google_drive_api.os.path.exists", return_value=True)
+    def test_refresh_that_returns_the_stored_token_does_not_rewrite_the_file(
+        self, _exists, mock_from_file, mock_build, mock_write
+    ):
+        creds = MagicMock(valid=False, expired=True, refresh_token="refresh", token="same")
+
+        def refresh(request):
+            creds.valid, creds.expired = True, False
+
+        creds.refresh.side_effect = refresh
+        creds.to_json.side_effect = lambda: creds.token
+        mock_from_file.return_value = creds
+
+        self.assertIsNotNone(google_drive_api.get_drive_service())
+        creds.refresh.assert_called_once()
+        mock_write.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
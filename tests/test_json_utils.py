@@ -0,0 +1,31 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+import json_utils
+
+
+def test_dumps_round_trips_and_keeps_non_ascii():
+    data = {"threads": [["¡Hola, señor! 🚀 1/1"]]}
+    encoded = json_utils.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert "señor".encode("utf-8") in encoded
+    assert json.loads(encoded) == data
+
+
+def test_dumps_falls_back_to_stdlib():
+    data = {"promotions": [{"text": "café", "image_id": None}]}
+    with patch("json_utils.orjson", None):
+        encoded = json_utils.dumps(data)
+    assert encoded == json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_loads_accepts_text_and_bytes_and_raises_stdlib_error(use_orjson):
+    data = {"threads": [["¡Hola! 1/1"]]}
+    with patch("json_utils.orjson", json_utils.orjson if use_orjson else None):
+        assert json_utils.loads(json.dumps(data)) == data
+        assert json_utils.loads(json_utils.dumps(data)) == data
+        with pytest.raises(json.JSONDecodeError):
+            json_utils.loads("not json")
@@ -7,6 +7,7 @@ import json
 from typing import Dict, Any, List
 from promo_library import (
     add_promo,
+    clear_promo_cache,
     delete_promo,
     get_all_promos,
 )
@@ -16,6 +17,9 @@ from unittest.mock import patch, MagicMock
 class TestPromoLibrary(unittest.TestCase):
     """Test suite for the promotional tweet library."""
 
+    def setUp(self) -> None:
+        clear_promo_cache()
+
     @patch("promo_library.upload_image")
     @patch("promo_library.write_file_content")
     @patch("promo_library.read_file_content")
@@ -125,6 +129,27 @@ class TestPromoLibrary(unittest.TestCase):
         promos = get_all_promos()
         self.assertEqual(promos, [])
 
+    @patch("promo_library.write_file_content", return_value="fake_file_id")
+    @patch("promo_library.read_file_content")
+    @patch("promo_library.find_file_in_folder", return_value="fake_file_id")
+    @patch("promo_library.get_or_create_workspace_folder", return_value="fake_workspace_id")
+    @patch("promo_library.get_drive_service")
+    def test_get_all_promos_is_cached_until_promos_change(
+        self, mock_get_service, mock_get_folder, mock_find_file, mock_read_content, mock_write_content
+    ) -> None:
+        """Test that promos are read from Drive once and the cache follows additions."""
+        mock_get_service.return_value = MagicMock()
+        mock_read_content.return_value = json.dumps({"promotions": [{"text": "First.", "image_id": None}]})
+
+        self.assertEqual(len(get_all_promos()), 1)
+        self.assertEqual(len(get_all_promos()), 1)
+        mock_read_content.assert_called_once()
+
+        add_promo("Second.")
+        promos = get_all_promos()
+        self.assertEqual([p["text"] for p in promos], ["First.", "Second."])
+        self.assertEqual(mock_read_content.call_count, 2)  # add_promo re-reads before writing
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -19,3 +19,13 @@ def test_split_respects_limit():
     tweets = AUTO_X.split_text_into_tweets(text, limit=50)
     assert all(len(t) <= 50 for t in tweets)
     assert "".join(tweets).replace(" ", "").startswith("Helloworld")
+
+
+def test_split_hard_cuts_long_words():
+    text = "a" * 25 + " tail end"
+    assert AUTO_X.split_text_into_tweets(text, limit=10) == ["a" * 10, "a" * 10, "aaaaa", "tail end"]
+
+
+def test_split_strips_whitespace_between_chunks():
+    text = "one two  \n  three four"
+    assert AUTO_X.split_text_into_tweets(text, limit=9) == ["one two", "three", "four"]
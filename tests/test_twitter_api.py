@@ -1,6 +1,9 @@
+import threading
 import unittest
 from unittest.mock import patch, MagicMock, call
 
+import tweepy
+
 from config import TwitterCredentials
 from twitter_api import publish_thread
 
@@ -19,9 +22,8 @@ class TestPublishThread(unittest.TestCase):
         mock_api = mock_api_class.return_value
 
         # --- Call the function ---
-        tweets = ["First tweet", "Second tweet"]
-        images = [None, None]
-        publish_thread(tweets, images, mock_client)
+        thread = [("First tweet", None), ("Second tweet", None)]
+        publish_thread(thread, mock_client)
 
         # --- Assertions ---
         # Assert create_tweet was called correctly
@@ -59,9 +61,8 @@ class TestPublishThread(unittest.TestCase):
         mock_load_creds.return_value = mock_creds
 
         # --- Call the function ---
-        tweets = ["Tweet with image", "Just text"]
-        images = ["/path/to/image.png", None]
-        publish_thread(tweets, images, mock_client)
+        thread = [("Tweet with image", "/path/to/image.png"), ("Just text", None)]
+        publish_thread(thread, mock_client)
 
         # --- Assertions ---
         # Assert media_upload was called once with the correct filename
@@ -73,4 +74,91 @@ class TestPublishThread(unittest.TestCase):
             call(text="Just text", in_reply_to_tweet_id=201, media_ids=None, user_auth=True),
         ]
         mock_client.create_tweet.assert_has_calls(calls)
-        self.assertEqual(mock_client.create_tweet.call_count, 2)
\ No newline at end of file
+        self.assertEqual(mock_client.create_tweet.call_count, 2)
+
+    @patch("twitter_api.load_twitter_credentials")
+    @patch("twitter_api.tweepy.API")
+    def test_publish_uses_given_oauth1_credentials(self, mock_api_class, mock_load_creds):
+        """Verify that credentials passed in are used instead of re-reading the environment."""
+        mock_client = MagicMock()
+        mock_client.create_tweet.return_value = MagicMock(data={"id": 301})
+        mock_api_class.return_value.media_upload.return_value = MagicMock(media_id=998)
+        creds = TwitterCredentials("key", "secret", "token", "token_secret")
+
+        publish_thread([("Tweet with image", "/path/to/image.png")], mock_client, oauth1_creds=creds)
+
+        mock_load_creds.assert_not_called()
+        mock_client.create_tweet.assert_called_once_with(
+            text="Tweet with image", in_reply_to_tweet_id=None, media_ids=[998], user_auth=True
+        )
+
+    @patch("twitter_api.tweepy.API")
+    def test_media_is_uploaded_before_tweets_and_matched_by_index(self, mock_api_class):
+        """Verify that all images are uploaded up front and attached to their own tweets."""
+        events = []
+        mock_client = MagicMock()
+        mock_client.create_tweet.side_effect = lambda **kwargs: events.append("tweet") or MagicMock(
+            data={"id": len(events)}
+        )
+        media_ids = {"/a.png": 11, "/c.png": 33}
+        mock_api_class.return_value.media_upload.side_effect = lambda filename: events.append(
+            "upload"
+        ) or MagicMock(media_id=media_ids[filename])
+        creds = TwitterCredentials("key", "secret", "token", "token_secret")
+
+        thread = [("A", "/a.png"), ("B", None), ("C", "/c.png")]
+        with patch("twitter_api.time.sleep"):
+            publish_thread(thread, mock_client, oauth1_creds=creds)
+
+        self.assertEqual(events[:2], ["upload", "upload"])
+        sent = [c.kwargs["media_ids"] for c in mock_client.create_tweet.call_args_list]
+        self.assertEqual(sent, [[11], None, [33]])
+
+    @patch("twitter_api.tweepy.API")
+    def test_each_upload_worker_uses_its_own_api_object(self, mock_api_class):
+        """Verify that no tweepy.API (and its requests.Session) is shared between threads."""
+        used_by = {}
+
+        def new_api(auth):
+            api = MagicMock()
+
+            def media_upload(filename):
+                used_by.setdefault(id(api), set()).add(threading.get_ident())
+                return MagicMock(media_id=len(filename))
+
+            api.media_upload.side_effect = media_upload
+            return api
+
+        mock_api_class.side_effect = new_api
+        mock_client = MagicMock()
+        mock_client.create_tweet.return_value = MagicMock(data={"id": 1})
+        creds = TwitterCredentials("key", "secret", "token", "token_secret")
+
+        thread = [(f"T{i}", f"/{i}.png") for i in range(8)]
+        with patch("twitter_api.time.sleep"):
+            publish_thread(thread, mock_client, oauth1_creds=creds)
+
+        self.assertTrue(used_by)
+        for threads in used_by.values():
+            self.assertEqual(len(threads), 1)
+
+    @patch("twitter_api.tweepy.API")
+    def test_failed_upload_aborts_before_any_tweet_is_posted(self, mock_api_class):
+        """Verify that one rejected upload among several stops the run before posting."""
+        response = MagicMock(status_code=403, reason="Forbidden")
+        response.json.return_value = {"errors": [{"code": 453, "message": "no access"}]}
+
+        def media_upload(filename):
+            if filename == "/b.png":
+                raise tweepy.errors.Forbidden(response)
+            return MagicMock(media_id=1)
+
+        mock_api_class.return_value.media_upload.side_effect = media_upload
+        mock_client = MagicMock()
+        creds = TwitterCredentials("key", "secret", "token", "token_secret")
+
+        thread = [("A", "/a.png"), ("B", "/b.png"), ("C", "/c.png")]
+        with patch("twitter_api.time.sleep"), self.assertRaises(PermissionError):
+            publish_thread(thread, mock_client, oauth1_creds=creds)
+
+        mock_client.create_tweet.assert_not_called()
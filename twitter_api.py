@@ -1,19 +1,22 @@
 """Wrapper around Tweepy for posting threads."""
 
-from typing import Callable, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 import json
 import logging
+import threading
 import time
 import tweepy
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
-from config import load_twitter_credentials
+from config import TwitterCredentials, load_twitter_credentials
 
 logger = logging.getLogger(__name__)
 
 MIN_DELAY_SECONDS = 18.0  # 50 tweet creations per 15 minutes -> ~18 seconds between calls
+MEDIA_UPLOAD_WORKERS = 4  # Images uploaded in parallel before the thread is posted
 
 
 @dataclass
@@ -149,27 +152,51 @@ def _describe_tweepy_error(exc: tweepy.errors.HTTPException) -> str:
     return " | ".join(parts)
 
 
+def _upload_media(api_v1: tweepy.API, path: str) -> int:
+    """Upload the image at ``path`` through the v1.1 API and return its media ID."""
+    try:
+        upload = api_v1.media_upload(filename=path)
+    except tweepy.errors.Forbidden as exc:
+        error_details = _describe_tweepy_error(exc)
+        logger.error("Media upload forbidden: %s", error_details)
+        raise PermissionError(
+            "Twitter rejected the media upload. Ensure your OAuth 1.0a credentials have Read & Write "
+            "permissions enabled and regenerate the Access Token & Secret in the developer portal. "
+            f"Details: {error_details}"
+        ) from exc
+    except tweepy.errors.Unauthorized as exc:
+        logger.error("Media upload failed due to unauthorized OAuth1 credentials: %s", exc)
+        raise PermissionError(
+            "Twitter reported that the OAuth 1.0a credentials are unauthorized. Double-check the "
+            "API key/secret and Access Token/Secret in the .env file, regenerating them if necessary."
+        ) from exc
+    return upload.media_id
+
+
 def publish_thread(
-    tweets: List[str],
-    images: List[Optional[str]],
+    thread: Sequence[Tuple[str, Optional[str]]],
     client_v2: tweepy.Client,
     *,
     start_index: int = 0,
     initial_reply_id: Optional[int] = None,
     delay_seconds: float = 2.0,
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    oauth1_creds: Optional[TwitterCredentials] = None,
 ) -> List[Optional[int]]:
     """
     Publish a sequence of tweets as a thread using an authenticated API v2 client.
 
+    Images for the remaining tweets are uploaded in parallel before the first tweet
+    is created, so a rejected upload stops the run before anything is posted.
+
     Args:
-        tweets: The ordered list of tweet texts.
-        images: Optional list of media paths aligned with ``tweets``.
+        thread: The ordered ``(text, image_path)`` pairs; ``image_path`` is None for text-only tweets.
         client_v2: Tweepy v2 client with OAuth 2.0 or OAuth 1.0a user context.
         start_index: Tweet index to resume from (defaults to 0).
         initial_reply_id: Parent tweet ID when resuming a partial thread.
         delay_seconds: Seconds to wait between tweets to avoid rate limits.
         progress_callback: Optional callable invoked with (index, tweet_id) after each success.
+        oauth1_creds: OAuth 1.0a credentials for media uploads; loaded from the environment if omitted.
 
     Returns:
         A list containing the tweet IDs for the indices that were posted in this run.
@@ -178,7 +205,7 @@ def publish_thread(
         RateLimitError: When Twitter returns HTTP 429.
         ThreadPublishPartialError: When posting stops mid-thread for other reasons.
     """
-    total = len(tweets)
+    total = len(thread)
     if total == 0:
         return []
 
@@ -186,10 +213,9 @@ def publish_thread(
 
     delay_seconds = max(delay_seconds, MIN_DELAY_SECONDS)
 
-    api_v1 = None
-    remaining_images = images[start_index:] if start_index < len(images) else []
-    if any(img for img in remaining_images):
-        creds_v1 = load_twitter_credentials()
+    auth_v1 = None
+    if any(img for _, img in thread[start_index:]):
+        creds_v1 = oauth1_creds or load_twitter_credentials()
         if not all([creds_v1.api_key, creds_v1.api_secret, creds_v1.access_token, creds_v1.access_secret]):
             raise ValueError(
                 "OAuth 1.0a credentials (API Key/Secret, Access Token/Secret) are required "
@@ -201,7 +227,25 @@ def publish_thread(
             creds_v1.access_token,
             creds_v1.access_secret,
         )
-        api_v1 = tweepy.API(auth_v1)
+
+    # Media uploads don't depend on each other, so they overlap instead of each one
+    # delaying its tweet; tweets are still created strictly in order below.
+    media_by_index: Dict[int, int] = {}
+    pending = [(idx, img) for idx, (_, img) in enumerate(thread[start_index:], start=start_index) if img]
+    if pending:
+        # tweepy.API wraps a requests.Session, which is not thread-safe, so each
+        # worker uploads through its own API object.
+        worker_apis = threading.local()
+
+        def upload(item: Tuple[int, str]) -> int:
+            api_v1 = getattr(worker_apis, "api", None)
+            if api_v1 is None:
+                api_v1 = worker_apis.api = tweepy.API(auth_v1)
+            return _upload_media(api_v1, item[1])
+
+        with ThreadPoolExecutor(max_workers=min(MEDIA_UPLOAD_WORKERS, len(pending))) as pool:
+            media_ids_list = list(pool.map(upload, pending))
+        media_by_index = {idx: media_id for (idx, _), media_id in zip(pending, media_ids_list)}
 
     logger.debug(
         "Publishing thread using OAuth 2.0 for tweets and OAuth 1.0a for media."
@@ -210,31 +254,9 @@ def publish_thread(
     previous_id: Optional[int] = initial_reply_id
     last_success_index = start_index - 1
 
-    for idx in range(start_index, total):
-        txt = tweets[idx]
-        img = images[idx] if idx < len(images) else None
-
-        media_ids = None
-        if img:
-            if not api_v1:
-                raise RuntimeError("Cannot upload media without a valid API v1.1 client.")
-            try:
-                upload = api_v1.media_upload(filename=img)
-            except tweepy.errors.Forbidden as exc:
-                error_details = _describe_tweepy_error(exc)
-                logger.error("Media upload forbidden: %s", error_details)
-                raise PermissionError(
-                    "Twitter rejected the media upload. Ensure your OAuth 1.0a credentials have Read & Write "
-                    "permissions enabled and regenerate the Access Token & Secret in the developer portal. "
-                    f"Details: {error_details}"
-                ) from exc
-            except tweepy.errors.Unauthorized as exc:
-                logger.error("Media upload failed due to unauthorized OAuth1 credentials: %s", exc)
-                raise PermissionError(
-                    "Twitter reported that the OAuth 1.0a credentials are unauthorized. Double-check the "
-                    "API key/secret and Access Token/Secret in the .env file, regenerating them if necessary."
-                ) from exc
-            media_ids = [upload.media_id]
+    for idx, (txt, _) in enumerate(thread[start_index:], start=start_index):
+        media_id = media_by_index.get(idx)
+        media_ids = [media_id] if media_id is not None else None
 
         try:
             # When using a client with both OAuth 1.0a and OAuth 2.0 credentials,